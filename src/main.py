@@ -207,7 +207,7 @@ class CompilationApp:
             # 5. Upload to YouTube if requested
             if upload_to_youtube:
                 logger.info("Authenticating with YouTube...")
-                if not self.youtube_uploader.authenticate():
+                if not await self.youtube_uploader.authenticate_async():
                     logger.error("YouTube authentication failed")
                     return compilation_path, shorts_paths
                 
@@ -15,10 +15,11 @@ from typing import Dict, List, Optional, Tuple, Union
 import cv2
 import numpy as np
 from loguru import logger
+from moviepy.config import get_setting
 from moviepy.editor import VideoFileClip
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageOps
 
-from src.utils.file_manager import FileManager
+from src.utils.file_manager import FileManager, safe_filename_title
 from src.video_collection.collector import VideoMetadata
 
 
@@ -525,8 +526,7 @@ class ThumbnailGenerator:
                 
                 if title:
                     # Convert title to a filename-friendly format
-                    safe_title = "".join(c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in title)
-                    safe_title = safe_title.strip().replace(' ', '_')
+                    safe_title = safe_filename_title(title)
                     output_path = os.path.join(self.app_config.thumbnail_dir, f"thumbnail_{safe_title}_{timestamp}.jpg")
                 else:
                     output_path = os.path.join(self.app_config.thumbnail_dir, f"thumbnail_{timestamp}.jpg")
@@ -635,6 +635,68 @@ class ThumbnailGenerator:
         except Exception as e:
             logger.error(f"Error creating thumbnail: {str(e)}")
             return None
+    
+    async def create_basic_thumbnail(
+        self,
+        title: str,
+        output_path: str,
+        video_path: Optional[str] = None,
+        frame_time: float = 3.5
+    ) -> Optional[str]:
+        """
+        Create a thumbnail from a single frame of a video.
+        
+        The frame is grabbed by an ffmpeg subprocess awaited on the event loop,
+        so other coroutines keep running while it decodes. Falls back to a
+        text-only thumbnail when no video is given or no frame can be read.
+        
+        Args:
+            title: Title to display on the thumbnail
+            output_path: Path to save the thumbnail
+            video_path: Path to the video to take the frame from (optional)
+            frame_time: Position of the frame in seconds (default skips the title card)
+            
+        Returns:
+            Path to the created thumbnail, None if failed
+        """
+        frame = None
+        
+        if video_path:
+            try:
+                # Decode one frame and stream it back as PNG over stdout
+                process = await asyncio.create_subprocess_exec(
+                    get_setting("FFMPEG_BINARY"),
+                    "-v", "error",
+                    "-ss", str(frame_time),
+                    "-i", video_path,
+                    "-frames:v", "1",
+                    "-f", "image2pipe",
+                    "-vcodec", "png",
+                    "-",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                stdout, stderr = await process.communicate()
+                
+                if process.returncode == 0 and stdout:
+                    frame = cv2.imdecode(np.frombuffer(stdout, dtype=np.uint8), cv2.IMREAD_COLOR)
+                else:
+                    logger.warning(f"Could not extract frame from {video_path}: {stderr.decode(errors='ignore').strip()}")
+            except Exception as e:
+                logger.warning(f"Error extracting frame from {video_path}: {str(e)}")
+        
+        # Composite in a worker thread; PIL drawing is CPU-bound
+        if frame is not None:
+            return await asyncio.to_thread(
+                self._create_thumbnail_manually,
+                frames=[frame],
+                title=title,
+                output_path=output_path,
+                width=self.width,
+                height=self.height
+            ) or None
+        
+        return await asyncio.to_thread(self._create_basic_thumbnail, title, None, output_path)
 
     def _create_basic_thumbnail(
         self,
@@ -58,6 +58,7 @@ class AppConfig(BaseSettings):
     thumbnail_dir: str = "data/thumbnails"
     shorts_dir: str = "data/shorts"  # Directory for YouTube Shorts
     log_dir: str = "logs"
+    cache_dir: str = "data/cache"  # Persistent lookups such as resolved playlist IDs
     max_file_age_days: int = 7
     max_videos_per_compilation: int = 200
     min_videos_per_compilation: int = 3
@@ -74,6 +75,7 @@ class AppConfig(BaseSettings):
     auto_upload: bool = False
     assets_dir: str = "data/assets"
     max_duration_per_clip: Optional[float] = None  # None means use full video length
+    use_ffmpeg_filtergraph: bool = True  # Render compilation clips in one ffmpeg pass
     
     class Config:
         env_prefix = "APP_"
@@ -6,6 +6,7 @@ and cleaning up temporary files.
 """
 
 import os
+import re
 import time
 import uuid
 import shutil
@@ -17,6 +18,22 @@ from loguru import logger
 
 from src.utils.config_loader import AppConfig, Config
 
+# Characters replaced when building filenames from titles (keeps letters, digits, "_", "-" and spaces)
+_UNSAFE_TITLE_CHARS = re.compile(r"[^\w\- ]")
+
+
+def safe_filename_title(title: str) -> str:
+    """
+    Convert a video title to a filename-friendly form.
+    
+    Args:
+        title: Title to convert
+        
+    Returns:
+        Title with unsafe characters and spaces replaced by underscores
+    """
+    return _UNSAFE_TITLE_CHARS.sub("_", title).strip().replace(' ', '_')
+
 
 class FileManager:
     """
@@ -44,6 +61,7 @@ class FileManager:
         os.makedirs(self.config.app.thumbnail_dir, exist_ok=True)
         os.makedirs(self.config.app.temp_dir, exist_ok=True)
         os.makedirs(self.config.app.shorts_dir, exist_ok=True)
+        os.makedirs(self.config.app.cache_dir, exist_ok=True)
         logger.debug("Ensured all required directories exist")
     
     def get_temp_path(self, extension: str = "mp4") -> str:
@@ -89,8 +107,7 @@ class FileManager:
         
         if title:
             # Convert title to a filename-friendly format
-            safe_title = "".join(c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in title)
-            safe_title = safe_title.strip().replace(' ', '_')
+            safe_title = safe_filename_title(title)
             filename = f"{prefix}_{safe_title}_{timestamp}.{extension}"
         else:
             filename = f"{prefix}_{timestamp}.{extension}"
@@ -113,8 +130,7 @@ class FileManager:
         
         if title:
             # Convert title to a filename-friendly format
-            safe_title = "".join(c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in title)
-            safe_title = safe_title.strip().replace(' ', '_')
+            safe_title = safe_filename_title(title)
             filename = f"{prefix}_{safe_title}_{timestamp}.{extension}"
         else:
             filename = f"{prefix}_{timestamp}.{extension}"
@@ -132,13 +148,14 @@ class FileManager:
         Returns:
             Path for the YouTube Short video
         """
-        timestamp = int(time.time())
+        # Shorts are rendered concurrently and a stream copy can finish within
+        # a second, so the video ID and a random suffix keep names unique
+        timestamp = f"{int(time.time())}_{uuid.uuid4().hex[:8]}"
         
         if title:
             # Convert title to a filename-friendly format
-            safe_title = "".join(c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in title)
-            safe_title = safe_title.strip().replace(' ', '_')
-            filename = f"short_{safe_title}_{timestamp}.mp4"
+            safe_title = safe_filename_title(title)
+            filename = f"short_{safe_title}_{video_id}_{timestamp}.mp4"
         else:
             filename = f"short_{video_id}_{timestamp}.mp4"
             
@@ -6,9 +6,12 @@ transitions, intro/outro clips, and dynamic metadata.
 """
 
 import asyncio
+import functools
+import hashlib
 import os
 import random
 import datetime
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Tuple
 
@@ -24,13 +27,56 @@ try:
         TextClip,
         concatenate_videoclips,
     )
+    from moviepy.audio.AudioClip import AudioArrayClip
+    from moviepy.config import get_setting
     import moviepy.video.fx.all as vfx
 except ImportError as e:
     logger.error(f"Error importing moviepy: {str(e)}")
     raise
 
-from src.utils.file_manager import FileManager
+from src.utils.file_manager import FileManager, safe_filename_title
 from src.video_collection.collector import VideoMetadata
+from src.video_processing.text_cache import text_clip
+
+
+@dataclass(frozen=True)
+class _ClipLayout:
+    """Geometry for placing a vertical 9:16 video inside a landscape frame."""
+    
+    width: int
+    height: int
+    center_width: int
+    x_pos: float
+    panel_width: int
+    logo_size: int
+
+
+@functools.lru_cache(maxsize=4)
+def _layout(output_size: Tuple[int, int]) -> _ClipLayout:
+    """
+    Compute the letterbox layout for an output size.
+    
+    The output size is fixed for a compilation, so the layout is computed once
+    and reused for every clip.
+    
+    Args:
+        output_size: Target size (width, height)
+        
+    Returns:
+        Layout for the given output size
+    """
+    width, height = output_size
+    center_width = int(height * 9/16)  # Width for 9:16 ratio
+    x_pos = (width - center_width) / 2
+    panel_width = int(x_pos)
+    return _ClipLayout(
+        width=width,
+        height=height,
+        center_width=center_width,
+        x_pos=x_pos,
+        panel_width=panel_width,
+        logo_size=int(min(panel_width * 0.5, height * 0.3))
+    )
 
 
 class TransitionMaker:
@@ -41,6 +87,10 @@ class TransitionMaker:
         """
         Create a fade transition between two clips.
         
+        The first clip fades out to black and the second fades in from black.
+        Both fades act on each clip's own frames, so the clips are chained
+        without compositing them over a shared canvas.
+        
         Args:
             clip1: First video clip
             clip2: Second video clip
@@ -49,9 +99,12 @@ class TransitionMaker:
         Returns:
             A single clip with the transition applied
         """
-        clip1 = clip1.crossfadeout(duration)
-        clip2 = clip2.crossfadein(duration)
-        return concatenate_videoclips([clip1, clip2], method="compose")
+        if clip1.size != clip2.size:
+            raise ValueError(f"Cannot fade between clips of different sizes: {clip1.size} and {clip2.size}")
+        
+        clip1 = clip1.fx(vfx.fadeout, duration)
+        clip2 = clip2.fx(vfx.fadein, duration)
+        return concatenate_videoclips([clip1, clip2], method="chain")
     
     @staticmethod
     def crossfade(clip1, clip2, duration=1.0):
@@ -177,6 +230,35 @@ class VideoCompiler:
         "random": None,  # Will be chosen randomly
     }
     
+    # Encoding parameters shared by every compilation segment. Segments are
+    # joined with "-c copy", so the ffmpeg and MoviePy writers must both be
+    # configured from these values only.
+    SEGMENT_FPS = 30
+    SEGMENT_VIDEO_CODEC = "libx264"
+    SEGMENT_PIX_FMT = "yuv420p"
+    SEGMENT_VIDEO_BITRATE = "4000k"
+    SEGMENT_PRESET = "medium"
+    SEGMENT_PROFILE = "high"
+    SEGMENT_LEVEL = "4.0"
+    SEGMENT_AUDIO_CODEC = "aac"
+    SEGMENT_AUDIO_FPS = 44100
+    SEGMENT_AUDIO_CHANNELS = 2
+    SEGMENT_AUDIO_BITRATE = "192k"
+    
+    # ffmpeg-python output options for segments rendered without MoviePy
+    SEGMENT_OUTPUT_ARGS = {
+        "vcodec": SEGMENT_VIDEO_CODEC,
+        "pix_fmt": SEGMENT_PIX_FMT,
+        "video_bitrate": SEGMENT_VIDEO_BITRATE,
+        "preset": SEGMENT_PRESET,
+        "profile:v": SEGMENT_PROFILE,
+        "level": SEGMENT_LEVEL,
+        "acodec": SEGMENT_AUDIO_CODEC,
+        "ar": SEGMENT_AUDIO_FPS,
+        "ac": SEGMENT_AUDIO_CHANNELS,
+        "audio_bitrate": SEGMENT_AUDIO_BITRATE,
+    }
+    
     def __init__(self, config, file_manager: Optional[FileManager] = None):
         """
         Initialize the video compiler.
@@ -188,6 +270,25 @@ class VideoCompiler:
         self.config = config
         self.app_config = config.app
         self.file_manager = file_manager or FileManager()
+        
+        # Black ColorClips keyed by size, shared across prepared clips
+        self._bg_cache: Dict[Tuple[int, int], ColorClip] = {}
+    
+    def _black_clip(self, size: Tuple[int, int]) -> ColorClip:
+        """
+        Get a shared black ColorClip of the given size.
+        
+        Args:
+            size: Clip size (width, height)
+            
+        Returns:
+            Cached ColorClip; callers derive copies via set_duration()
+        """
+        bg = self._bg_cache.get(size)
+        if bg is None:
+            bg = ColorClip(size, color=(0, 0, 0))
+            self._bg_cache[size] = bg
+        return bg
     
     def _create_title_clip(
         self,
@@ -233,8 +334,8 @@ class VideoCompiler:
         txt_clip = txt_clip.set_duration(duration)
         txt_clip = txt_clip.set_position("center")
         
-        # Combine the text and background
-        result = CompositeVideoClip([bg_clip, txt_clip])
+        # Combine the text and background (no audio track to mux)
+        result = CompositeVideoClip([bg_clip, txt_clip]).without_audio()
         
         return result
     
@@ -283,132 +384,122 @@ class VideoCompiler:
                 logger.info(f"Using full length of video {video_metadata.id} ({clip.duration:.2f}s)")
             
             # Create a black background for our 16:9 format
-            bg = ColorClip(output_size, color=(0, 0, 0))
+            bg = self._black_clip(output_size)
             bg = bg.set_duration(clip.duration)
             
-            # Calculate the size for the vertical video in the center
-            # For vertical TikTok videos (9:16) inside a 16:9 frame
-            # We maintain the original aspect ratio while fitting within the height
-            center_height = output_size[1]
-            center_width = int(center_height * 9/16)  # Width for 9:16 ratio
+            # Vertical TikTok videos (9:16) are centered inside the 16:9 frame,
+            # keeping the original aspect ratio while fitting within the height
+            layout = _layout(output_size)
             
             # Resize clip to fit in the center while maintaining aspect ratio
-            resized_clip = clip.resize(height=center_height)
+            resized_clip = clip.resize(height=layout.height)
             
             # If the video is too wide after resizing, crop it to 9:16 aspect ratio
-            if resized_clip.w > center_width:
+            if resized_clip.w > layout.center_width:
                 # Center crop
                 x_center = resized_clip.w / 2
-                x1 = x_center - center_width / 2
-                x2 = x_center + center_width / 2
-                resized_clip = resized_clip.crop(x1=x1, x2=x2, y1=0, y2=center_height)
+                x1 = x_center - layout.center_width / 2
+                x2 = x_center + layout.center_width / 2
+                resized_clip = resized_clip.crop(x1=x1, x2=x2, y1=0, y2=layout.height)
             
             # Position the clip in the center
-            x_pos = (output_size[0] - center_width) / 2
-            resized_clip = resized_clip.set_position((x_pos, 0))
+            resized_clip = resized_clip.set_position((layout.x_pos, 0))
             
             # Create side panels with black background
-            left_panel_width = int(x_pos)
-            right_panel_width = int(x_pos)
-            
-            left_panel = ColorClip((left_panel_width, output_size[1]), color=(0, 0, 0))
+            left_panel = self._black_clip((layout.panel_width, layout.height))
             left_panel = left_panel.set_duration(clip.duration)
             left_panel = left_panel.set_position((0, 0))
             
-            right_panel = ColorClip((right_panel_width, output_size[1]), color=(0, 0, 0))
+            right_panel = self._black_clip((layout.panel_width, layout.height))
             right_panel = right_panel.set_duration(clip.duration)
-            right_panel = right_panel.set_position((output_size[0] - right_panel_width, 0))
-            
-            # Create TikTok logos for left and right sides
-            logo_base_size = int(min(left_panel_width * 0.5, output_size[1] * 0.3))
+            right_panel = right_panel.set_position((layout.width - layout.panel_width, 0))
             
             # Left TikTok logo - "Tik" with pink color (#ff0050)
-            left_logo = TextClip(
+            left_logo = text_clip(
                 "Tik",
-                fontsize=logo_base_size,
+                fontsize=layout.logo_size,
                 color='#ff0050',  # TikTok pink/red color
                 font='Arial-Bold',
-                align="center"
+                duration=clip.duration
             )
-            left_logo = left_logo.set_duration(clip.duration)
-            left_logo = left_logo.set_position((left_panel_width/2 - left_logo.w/2, output_size[1]/2 - left_logo.h/2))
+            left_logo = left_logo.set_position((layout.panel_width/2 - left_logo.w/2, layout.height/2 - left_logo.h/2))
             
             # Right TikTok logo - "Tok" with cyan color (#00f2ea)
-            right_logo = TextClip(
+            right_logo = text_clip(
                 "Tok",
-                fontsize=logo_base_size,
+                fontsize=layout.logo_size,
                 color='#00f2ea',  # TikTok teal/cyan color
                 font='Arial-Bold',
-                align="center"
+                duration=clip.duration
             )
-            right_logo = right_logo.set_duration(clip.duration)
-            right_logo = right_logo.set_position((output_size[0] - right_panel_width/2 - right_logo.w/2, output_size[1]/2 - right_logo.h/2))
+            right_logo = right_logo.set_position((layout.width - layout.panel_width/2 - right_logo.w/2, layout.height/2 - right_logo.h/2))
             
             # Add TikTok watermark
-            tiktok_watermark = TextClip(
+            tiktok_watermark = text_clip(
                 "TikTok",
                 fontsize=24,
                 color='white',
                 font='Arial-Bold',
-                align="center"
+                duration=clip.duration
             )
-            tiktok_watermark = tiktok_watermark.set_duration(clip.duration)
-            tiktok_watermark = tiktok_watermark.set_position((output_size[0] - tiktok_watermark.w - 10, 10))
+            tiktok_watermark = tiktok_watermark.set_position((layout.width - tiktok_watermark.w - 10, 10))
             
             # Creator username at the top
             elements = [bg, left_panel, right_panel, resized_clip, left_logo, right_logo, tiktok_watermark]
             
             if add_title and self.app_config.include_video_titles and video_metadata.author:
-                creator_text = TextClip(
+                creator_text = text_clip(
                     f"@{video_metadata.author}",
                     fontsize=36,
                     color='white',
                     font='Arial-Bold',
-                    align="center"
+                    duration=clip.duration
                 )
-                creator_text = creator_text.set_duration(clip.duration)
                 creator_text = creator_text.set_position(("center", 30))
                 elements.append(creator_text)
             
             # Add channel name at the bottom
             channel_name = "TikTokWeeklyTop"
-            channel_text = TextClip(
+            channel_text = text_clip(
                 f"@{channel_name}",
                 fontsize=48,
                 color='white',
                 font='Arial-Bold',
-                align="center"
+                duration=clip.duration
             )
-            channel_text = channel_text.set_duration(clip.duration)
-            channel_text = channel_text.set_position(("center", output_size[1] - 100))
+            channel_text = channel_text.set_position(("center", layout.height - 100))
             elements.append(channel_text)
             
             # Add subscribe text
-            subscribe_text = TextClip(
+            subscribe_text = text_clip(
                 "SUBSCRIBE FOR MORE TIKTOK COMPILATIONS",
                 fontsize=30,
                 color='white',
                 font='Arial-Bold',
-                align="center"
+                duration=clip.duration
             )
-            subscribe_text = subscribe_text.set_duration(clip.duration)
-            subscribe_text = subscribe_text.set_position(("center", output_size[1] - 50))
+            subscribe_text = subscribe_text.set_position(("center", layout.height - 50))
             elements.append(subscribe_text)
             
             # Small TikTok logo in bottom right corner
-            tiktok_icon = TextClip(
+            tiktok_icon = text_clip(
                 "♫",  # Musical note symbol
                 fontsize=36,
                 color='#00f2ea',  # TikTok teal color
                 font='Arial-Bold',
-                align="center"
+                duration=clip.duration
             )
-            tiktok_icon = tiktok_icon.set_duration(clip.duration)
-            tiktok_icon = tiktok_icon.set_position((output_size[0] - 50, output_size[1] - 50))
+            tiktok_icon = tiktok_icon.set_position((layout.width - 50, layout.height - 50))
             elements.append(tiktok_icon)
             
-            # Create the final composite
-            final_clip = CompositeVideoClip(elements)
+            # Only the source video contributes audio; mute the synthetic layers
+            for element in elements:
+                if element is not resized_clip:
+                    element.audio = None
+            
+            # Create the final composite, using our black background directly
+            # instead of blitting it onto another generated canvas
+            final_clip = CompositeVideoClip(elements, use_bgclip=True)
             
             # Adjust volume
             if clip.audio is not None and volume != 1.0:
@@ -420,6 +511,119 @@ class VideoCompiler:
             logger.error(f"Error preparing clip {video_metadata.id}: {str(e)}")
             return None
     
+    async def _prepare_clip_ffmpeg(
+        self,
+        video_metadata: VideoMetadata,
+        output_size: Tuple[int, int] = None,
+        add_title: bool = True,
+        max_duration: float = None,
+        volume: float = 1.0
+    ) -> Optional[Path]:
+        """
+        Render a compilation segment with a single ffmpeg filter graph.
+        
+        Produces the same layout as _prepare_clip (centered 9:16 video, side
+        panels and text branding), but scaling, cropping, padding and text
+        overlays all run inside one ffmpeg pass instead of MoviePy's per-frame
+        compositing. The segment uses the shared segment encoding parameters.
+        
+        Args:
+            video_metadata: Video metadata
+            output_size: Target size (width, height) for the clip
+            add_title: Whether to add the creator overlay
+            max_duration: Maximum duration of the clip in seconds (None for full length)
+            volume: Volume multiplier for the clip's audio
+            
+        Returns:
+            Path to the rendered segment, or None if rendering failed
+        """
+        try:
+            video_path = video_metadata.local_path
+            if not video_path or not os.path.exists(video_path):
+                logger.error(f"Video file not found: {video_path}")
+                return None
+            
+            if output_size is None:
+                output_size = (1920, 1080)
+            layout = _layout(output_size)
+            
+            probe = await asyncio.to_thread(ffmpeg.probe, video_path)
+            duration = float(probe["format"]["duration"])
+            has_audio = any(stream["codec_type"] == "audio" for stream in probe["streams"])
+            
+            # Keep the middle section when trimming, like _prepare_clip
+            start = 0.0
+            if max_duration is not None and duration > max_duration:
+                start = duration / 2 - max_duration / 2
+                duration = max_duration
+                logger.info(f"Trimmed video {video_metadata.id} to {max_duration}s")
+            
+            source = ffmpeg.input(video_path, ss=start, t=duration)
+            video = (
+                source.video
+                .filter("scale", -2, layout.height)
+                .filter("crop", f"min(iw,{layout.center_width})", "ih")
+                .filter("pad", layout.width, layout.height, "(ow-iw)/2", 0, "black")
+                .filter("fps", fps=self.SEGMENT_FPS)
+            )
+            
+            # (text, fontsize, color, x, y) - mirrors the MoviePy overlays
+            overlays = [
+                ("Tik", layout.logo_size, "#ff0050", f"{layout.panel_width}/2-text_w/2", "(h-text_h)/2"),
+                ("Tok", layout.logo_size, "#00f2ea", f"w-{layout.panel_width}/2-text_w/2", "(h-text_h)/2"),
+                ("TikTok", 24, "white", "w-text_w-10", "10"),
+            ]
+            if add_title and self.app_config.include_video_titles and video_metadata.author:
+                overlays.append((f"@{video_metadata.author}", 36, "white", "(w-text_w)/2", "30"))
+            overlays.extend([
+                ("@TikTokWeeklyTop", 48, "white", "(w-text_w)/2", "h-100"),
+                ("SUBSCRIBE FOR MORE TIKTOK COMPILATIONS", 30, "white", "(w-text_w)/2", "h-50"),
+                ("♫", 36, "#00f2ea", "w-50", "h-50"),
+            ])
+            for text, fontsize, color, x, y in overlays:
+                # Titles are literal text: with expansion off, ffmpeg-python's
+                # "%" escaping for the expansion pass must be skipped too
+                video = video.drawtext(
+                    text=text,
+                    x=x,
+                    y=y,
+                    fontsize=fontsize,
+                    fontcolor=color,
+                    font="Arial:style=Bold",
+                    expansion="none",
+                    escape_text=False
+                )
+            
+            if has_audio:
+                audio = source.audio
+                if volume != 1.0:
+                    audio = audio.filter("volume", volume)
+            else:
+                # Every segment needs an audio stream for stream-copy concatenation
+                audio = ffmpeg.input(
+                    f"anullsrc=channel_layout=stereo:sample_rate={self.SEGMENT_AUDIO_FPS}",
+                    f="lavfi",
+                    t=duration
+                ).audio
+            
+            segment_path = Path(self.file_manager.get_temp_path("mp4"))
+            await asyncio.to_thread(
+                ffmpeg.output(video, audio, str(segment_path), **self.SEGMENT_OUTPUT_ARGS).overwrite_output().run,
+                cmd=get_setting("FFMPEG_BINARY"),
+                quiet=True
+            )
+            
+            logger.info(f"Rendered video {video_metadata.id} with ffmpeg filter graph ({duration:.2f}s)")
+            return segment_path
+            
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode(errors="ignore") if e.stderr else str(e)
+            logger.warning(f"ffmpeg render failed for clip {video_metadata.id}: {stderr}")
+            return None
+        except Exception as e:
+            logger.warning(f"Error rendering clip {video_metadata.id} with ffmpeg: {str(e)}")
+            return None
+    
     def _select_transition(self, transition_type: str = None) -> callable:
         """
         Select a transition function.
@@ -441,6 +645,178 @@ class VideoCompiler:
         
         return self.TRANSITIONS[transition_type]
     
+    def _write_segment(self, clip, segment_path: Path) -> None:
+        """
+        Render a clip to a compilation segment file.
+        
+        All segments share codec, frame rate, resolution and audio layout so
+        that they can be joined with the ffmpeg concat demuxer without
+        re-encoding.
+        
+        Args:
+            clip: Prepared video clip
+            segment_path: Path to write the segment to
+        """
+        if clip.audio is None:
+            # Every segment needs an audio stream for stream-copy concatenation
+            samples = max(1, int(clip.duration * self.SEGMENT_AUDIO_FPS))
+            silence = AudioArrayClip(
+                np.zeros((samples, self.SEGMENT_AUDIO_CHANNELS)),
+                fps=self.SEGMENT_AUDIO_FPS
+            )
+            clip = clip.set_audio(silence)
+        
+        # MoviePy reads source audio as stereo, matching SEGMENT_AUDIO_CHANNELS
+        clip.write_videofile(
+            str(segment_path),
+            fps=self.SEGMENT_FPS,
+            codec=self.SEGMENT_VIDEO_CODEC,
+            audio_codec=self.SEGMENT_AUDIO_CODEC,
+            audio_fps=self.SEGMENT_AUDIO_FPS,
+            bitrate=self.SEGMENT_VIDEO_BITRATE,
+            audio_bitrate=self.SEGMENT_AUDIO_BITRATE,
+            temp_audiofile=str(segment_path.with_suffix(".m4a")),
+            threads=4,
+            preset=self.SEGMENT_PRESET,
+            ffmpeg_params=[
+                "-profile:v", self.SEGMENT_PROFILE,
+                "-level", self.SEGMENT_LEVEL,
+                "-pix_fmt", self.SEGMENT_PIX_FMT
+            ]
+        )
+    
+    def _render_title_card(
+        self,
+        title: str,
+        width: int = 1920,
+        height: int = 1080,
+        duration: float = 3.0
+    ) -> Optional[Path]:
+        """
+        Render the compilation title card directly with ffmpeg.
+        
+        The card is generated from a lavfi color source with drawtext, so no
+        frames pass through Python. It is encoded with the shared segment
+        parameters and cached by title, size and those parameters, so re-runs
+        reuse it.
+        
+        Args:
+            title: Title text
+            width: Card width
+            height: Card height
+            duration: Card duration in seconds
+            
+        Returns:
+            Path to the rendered title card, or None if rendering failed
+        """
+        # Include the encoding parameters: a card encoded with older settings
+        # would no longer stream-copy cleanly with the other segments
+        key = f"{title}|{width}x{height}|{duration}|{self.SEGMENT_FPS}|{sorted(self.SEGMENT_OUTPUT_ARGS.items())}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        cache_dir = Path(self.app_config.temp_dir) / "title_cards"
+        card_path = cache_dir / f"title_{digest}.mp4"
+        
+        if card_path.exists():
+            logger.debug(f"Reusing cached title card: {card_path}")
+            return card_path
+        
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            video = ffmpeg.input(
+                f"color=c=black:s={width}x{height}:r={self.SEGMENT_FPS}:d={duration}",
+                f="lavfi"
+            ).video.drawtext(
+                text=title,
+                x="(w-text_w)/2",
+                y="(h-text_h)/2",
+                fontsize=70,
+                fontcolor="white",
+                font="Arial",
+                # Draw "%" in titles literally
+                expansion="none",
+                escape_text=False
+            )
+            audio = ffmpeg.input(
+                f"anullsrc=channel_layout=stereo:sample_rate={self.SEGMENT_AUDIO_FPS}",
+                f="lavfi",
+                t=duration
+            ).audio
+            
+            # Write to a temporary name so an interrupted run never leaves a
+            # truncated file in the cache
+            partial_path = card_path.with_suffix(".partial.mp4")
+            (
+                ffmpeg
+                .output(
+                    video,
+                    audio,
+                    str(partial_path),
+                    **self.SEGMENT_OUTPUT_ARGS
+                )
+                .overwrite_output()
+                .run(cmd=get_setting("FFMPEG_BINARY"), quiet=True)
+            )
+            partial_path.replace(card_path)
+            
+            return card_path
+            
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode(errors="ignore") if e.stderr else str(e)
+            logger.warning(f"ffmpeg title card render failed: {stderr}")
+            return None
+        except Exception as e:
+            logger.warning(f"Error rendering title card: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _close_clip(clip) -> None:
+        """
+        Close a clip and any clips it is composed of.
+        
+        Closing a composite alone leaves its source readers open, so the
+        children are closed too to release decoder processes and file handles.
+        
+        Args:
+            clip: Clip to close
+        """
+        for child in getattr(clip, "clips", []):
+            VideoCompiler._close_clip(child)
+        clip.close()
+    
+    def _concat_segments(self, segment_paths: List[Path], output_path: str) -> bool:
+        """
+        Join segment files with the ffmpeg concat demuxer (stream copy).
+        
+        Args:
+            segment_paths: Segment files in playback order
+            output_path: Path of the final compilation video
+            
+        Returns:
+            True if the compilation was written, False if ffmpeg failed
+        """
+        list_path = segment_paths[0].with_suffix(".txt")
+        with open(list_path, "w") as f:
+            for segment_path in segment_paths:
+                escaped = str(segment_path.resolve()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        
+        try:
+            (
+                ffmpeg
+                .input(str(list_path), format="concat", safe=0)
+                .output(output_path, c="copy")
+                .overwrite_output()
+                .run(cmd=get_setting("FFMPEG_BINARY"), quiet=True)
+            )
+            return True
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode(errors="ignore") if e.stderr else str(e)
+            logger.error(f"ffmpeg concat failed: {stderr}")
+            return False
+        finally:
+            list_path.unlink(missing_ok=True)
+    
     async def create_compilation(
         self,
         video_metadata_list: List[VideoMetadata],
@@ -508,15 +884,48 @@ class VideoCompiler:
             temp_dir = Path(self.app_config.temp_dir)
             temp_dir.mkdir(parents=True, exist_ok=True)
             
-            # List to store all video segments
-            final_clips = []
-            
             # Set correct output dimensions for 16:9 horizontal format
             output_width = 1920
             output_height = 1080
             
+            # Generate output path with title if provided
+            timestamp = int(datetime.datetime.now().timestamp())
+            if title:
+                # Create safe filename from title
+                safe_title = safe_filename_title(title)
+                output_filename = f"compilation_{safe_title}_{timestamp}.mp4"
+            else:
+                output_filename = f"compilation_{timestamp}.mp4"
+                
+            output_path = os.path.join(self.app_config.compilation_dir, output_filename)
+            
+            # Ensure the output directory exists
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            
+            # Segment files in playback order. Each clip is rendered to disk and
+            # closed as soon as it is ready, so only one clip is open at a time.
+            # Renders run in a worker thread to keep the event loop responsive.
+            segment_paths = []
+            
+            async def render_segment(clip) -> None:
+                segment_path = temp_dir / f"seg_{timestamp}_{len(segment_paths)}.mp4"
+                try:
+                    await asyncio.to_thread(self._write_segment, clip, segment_path)
+                finally:
+                    self._close_clip(clip)
+                segment_paths.append(segment_path)
+            
             # Add title slide if needed
+            title_card_path = None
             if title:
+                title_card_path = await asyncio.to_thread(
+                    self._render_title_card, title, output_width, output_height
+                )
+            if title_card_path is not None:
+                segment_paths.append(title_card_path)
+                logger.info("Added title slide to compilation")
+            elif title:
+                # Fall back to rendering the title with MoviePy
                 # Create title text
                 txt_clip = TextClip(
                     title,
@@ -539,7 +948,8 @@ class VideoCompiler:
                 
                 # Combine text and background
                 title_clip = CompositeVideoClip([bg_clip, txt_clip])
-                final_clips.append(title_clip)
+                title_clip = title_clip.without_audio()
+                await render_segment(title_clip)
                 logger.info("Added title slide to compilation")
             
             # Process intro if specified
@@ -548,7 +958,7 @@ class VideoCompiler:
                     intro_clip = VideoFileClip(intro_path)
                     # Resize intro to match output dimensions
                     intro_clip = intro_clip.resize(width=output_width, height=output_height)
-                    final_clips.append(intro_clip)
+                    await render_segment(intro_clip)
                     logger.info(f"Added intro clip: {intro_path}")
                 except Exception as e:
                     logger.error(f"Error loading intro clip {intro_path}: {str(e)}")
@@ -556,6 +966,21 @@ class VideoCompiler:
             # Process each video with watermarks
             for i, metadata in enumerate(selected_videos):
                 try:
+                    # Render straight to a segment file when possible
+                    segment_path = None
+                    if self.app_config.use_ffmpeg_filtergraph:
+                        segment_path = await self._prepare_clip_ffmpeg(
+                            metadata,
+                            output_size=(output_width, output_height),
+                            add_title=True,
+                            max_duration=max_duration_per_clip
+                        )
+                    
+                    if segment_path is not None:
+                        segment_paths.append(segment_path)
+                        logger.info(f"Added video {i+1}/{len(selected_videos)}: {metadata.id}")
+                        continue
+                    
                     # Prepare clip with watermarks - use 16:9 aspect ratio
                     prepared_clip = await self._prepare_clip(
                         metadata,
@@ -565,8 +990,9 @@ class VideoCompiler:
                     )
                     
                     if prepared_clip:
-                        final_clips.append(prepared_clip)
-                        logger.info(f"Added video {i+1}/{len(selected_videos)}: {metadata.id} (duration: {prepared_clip.duration:.2f}s)")
+                        duration = prepared_clip.duration
+                        await render_segment(prepared_clip)
+                        logger.info(f"Added video {i+1}/{len(selected_videos)}: {metadata.id} (duration: {duration:.2f}s)")
                     else:
                         logger.warning(f"Failed to prepare video {metadata.id}")
                 except Exception as e:
@@ -578,49 +1004,25 @@ class VideoCompiler:
                     outro_clip = VideoFileClip(outro_path)
                     # Resize outro to match output dimensions
                     outro_clip = outro_clip.resize(width=output_width, height=output_height)
-                    final_clips.append(outro_clip)
+                    await render_segment(outro_clip)
                     logger.info(f"Added outro clip: {outro_path}")
                 except Exception as e:
                     logger.error(f"Error loading outro clip {outro_path}: {str(e)}")
             
-            if not final_clips:
+            if not segment_paths:
                 logger.error("No valid video clips to compile")
                 return None
             
-            # Generate output path with title if provided
-            timestamp = int(datetime.datetime.now().timestamp())
-            if title:
-                # Create safe filename from title
-                safe_title = "".join(c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in title)
-                safe_title = safe_title.strip().replace(' ', '_')
-                output_filename = f"compilation_{safe_title}_{timestamp}.mp4"
-            else:
-                output_filename = f"compilation_{timestamp}.mp4"
-                
-            output_path = os.path.join(self.app_config.compilation_dir, output_filename)
-            
-            # Ensure the output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            # Concatenate clips
-            logger.info(f"Concatenating {len(final_clips)} video clips")
-            final_compilation = concatenate_videoclips(final_clips, method="chain")
-            
-            # Write the final video - force 16:9 aspect ratio
-            logger.info(f"Writing compilation to {output_path}")
-            final_compilation.write_videofile(
-                output_path,
-                codec="libx264",
-                audio_codec="aac",
-                bitrate="4000k",
-                audio_bitrate="192k",
-                threads=4,
-                preset="medium"
-            )
-            
-            # Close all clips to free resources
-            for clip in final_clips:
-                clip.close()
+            # Join the segments at the container level - no pixel work
+            logger.info(f"Concatenating {len(segment_paths)} segments into {output_path}")
+            try:
+                if not await asyncio.to_thread(self._concat_segments, segment_paths, output_path):
+                    return None
+            finally:
+                for segment_path in segment_paths:
+                    # The title card is cached for later runs
+                    if segment_path != title_card_path:
+                        segment_path.unlink(missing_ok=True)
             
             logger.success(f"Compilation created: {output_path}")
             return output_path
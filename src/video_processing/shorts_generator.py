@@ -5,17 +5,97 @@ This module handles the creation of YouTube Shorts (vertical videos)
 from TikTok videos or compilations, ensuring they meet the requirements for YouTube Shorts.
 """
 
+import asyncio
+import functools
+import itertools
 import os
-from typing import List, Optional
+import subprocess
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+import ffmpeg
 from loguru import logger
-from moviepy.editor import TextClip, VideoFileClip, CompositeVideoClip, concatenate_videoclips, ColorClip
+from moviepy.config import get_setting
+from moviepy.editor import VideoFileClip, CompositeVideoClip, concatenate_videoclips, ColorClip
 from moviepy.video.fx.resize import resize
 
 from src.utils.config_loader import Config
-from src.utils.file_manager import FileManager
+from src.utils.file_manager import FileManager, safe_filename_title
 from src.video_collection.collector import VideoMetadata
+from src.video_processing.text_cache import text_clip
+
+
+# Hardware H.264 encoders in order of preference, with the ffmpeg options for each
+HW_H264_ENCODERS = {
+    "h264_nvenc": ["-b:v", "8M", "-rc", "vbr", "-preset", "p4", "-pix_fmt", "yuv420p"],
+    "h264_qsv": ["-global_quality", "23"],
+    "h264_videotoolbox": ["-b:v", "8M", "-pix_fmt", "yuv420p"],
+}
+
+# Simultaneous hardware encodes; consumer GPU drivers cap concurrent sessions
+HW_MAX_SESSIONS = 2
+
+
+def _encoder_works(ffmpeg_binary: str, encoder: str) -> bool:
+    """
+    Check that an encoder can actually encode on this machine.
+    
+    ffmpeg lists hardware encoders it was built with even when the GPU or
+    driver is missing, so a tiny test encode is the only reliable check.
+    The test uses the same options as real encodes, since older ffmpeg or
+    driver builds may accept the encoder but reject e.g. NVENC's p4 preset.
+    
+    Args:
+        ffmpeg_binary: Path to the ffmpeg executable
+        encoder: ffmpeg encoder name
+        
+    Returns:
+        True if the test encode succeeded
+    """
+    cmd = [
+        ffmpeg_binary, "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+        "-c:v", encoder, *HW_H264_ENCODERS.get(encoder, []),
+        "-f", "null", "-"
+    ]
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=30).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _pick_h264_encoder() -> str:
+    """
+    Pick the fastest available H.264 encoder.
+    
+    Prefers hardware encoders (NVENC, Quick Sync, VideoToolbox) and falls
+    back to libx264. The probe runs once per process.
+    
+    Returns:
+        ffmpeg encoder name
+    """
+    ffmpeg_binary = get_setting("FFMPEG_BINARY")
+    try:
+        result = subprocess.run(
+            [ffmpeg_binary, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Could not list ffmpeg encoders, using libx264: {str(e)}")
+        return "libx264"
+    
+    for encoder in HW_H264_ENCODERS:
+        if encoder in result.stdout and _encoder_works(ffmpeg_binary, encoder):
+            logger.info(f"Using hardware H.264 encoder: {encoder}")
+            return encoder
+    
+    logger.info("No hardware H.264 encoder available, using libx264")
+    return "libx264"
 
 
 class ShortsGenerator:
@@ -27,6 +107,9 @@ class ShortsGenerator:
     - Max duration of 60 seconds
     """
     
+    # ffmpeg threads per encode; concurrent encodes are sized to fill the CPU
+    ENCODER_THREADS = 2
+    
     def __init__(self, config: Optional[Config] = None, file_manager: Optional[FileManager] = None):
         """
         Initialize the YouTube Shorts generator.
@@ -39,6 +122,23 @@ class ShortsGenerator:
         
         self.config = config or ConfigLoader().get_config()
         self.file_manager = file_manager or FileManager(self.config)
+        
+        # Shorts aspect ratio (width, height)
+        self._target_ar = (9, 16)
+        
+        # Filename sequence for compilation Shorts; unlike a seconds timestamp it
+        # never repeats when several Shorts are created in the same second
+        self._seq = itertools.count(int(time.time() * 1000))
+        
+        # Resolve the encoder and its options once; every write reuses them
+        self._codec = _pick_h264_encoder()
+        self._codec_params = HW_H264_ENCODERS.get(self._codec, [])
+        # MoviePy always passes -preset; x264 presets only apply to libx264
+        self._codec_preset = "ultrafast" if self._codec == "libx264" else "medium"
+        self._ffmpeg_output_args = self._build_ffmpeg_output_args()
+        
+        # Semi-transparent banner backgrounds keyed by size, shared across Shorts
+        self._banner_cache: Dict[Tuple[int, int], ColorClip] = {}
     
     async def create_short_from_compilation(
         self,
@@ -68,35 +168,35 @@ class ShortsGenerator:
             logger.info(f"Creating YouTube Short from compilation video: {compilation_path}")
             
             # Generate output path for the Short
-            timestamp = int(datetime.now().timestamp())
+            timestamp = f"{next(self._seq)}_{os.getpid()}"
             if title:
                 # Create safe filename from title
-                safe_title = "".join(c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in title)
-                safe_title = safe_title.strip().replace(' ', '_')
+                safe_title = safe_filename_title(title)
                 short_path = os.path.join(self.config.app.shorts_dir, f"short_{safe_title}_{timestamp}.mp4")
             else:
                 short_path = os.path.join(self.config.app.shorts_dir, f"compilation_short_{timestamp}.mp4")
             
-            # Load the compilation video
+            # Crop, branding and truncation in a single ffmpeg filter graph
+            if await self._render_compilation_short_ffmpeg(
+                compilation_path, short_path, max_duration, include_branding
+            ):
+                logger.success(f"Created YouTube Short from compilation: {short_path}")
+                return short_path
+            
+            # Fall back to compositing with MoviePy
             with VideoFileClip(compilation_path) as clip:
-                # Select a portion if the compilation is too long
+                # Take the first part of the compilation if it is too long
                 if clip.duration > max_duration:
                     logger.info(f"Compilation video is {clip.duration:.1f}s, truncating to {max_duration:.1f}s")
-                    
-                    # Take the first part of the compilation, ensuring we include complete clips
-                    # This is a simple approach - could be enhanced to select the best segments
                     clip = clip.subclip(0, max_duration)
                 
-                # Ensure vertical format (9:16 aspect ratio)
+                # If the video is wider than 9:16, crop it to make it vertical
                 width, height = clip.size
-                
-                # If the video is horizontal, crop it to make it vertical
-                if width > height:
-                    # Calculate the new width to make it vertical (9:16 ratio)
-                    new_width = int(height * 9 / 16)
-                    # Crop from the center
-                    x1 = max(0, int((width - new_width) / 2))
-                    clip = clip.crop(x1=x1, y1=0, x2=x1+new_width, y2=height)
+                ar_width, ar_height = self._target_ar
+                if width * ar_height > height * ar_width:
+                    new_width = height * ar_width // ar_height // 2 * 2  # Even width for yuv420p
+                    x1 = (width - new_width) // 2
+                    clip = clip.crop(x1=x1, y1=0, x2=x1 + new_width, y2=height)
                     logger.info(f"Cropped horizontal video to vertical format: {new_width}x{height}")
                 
                 # Add branding if requested
@@ -107,17 +207,23 @@ class ShortsGenerator:
                         title=title
                     )
                 
-                # Write the Short
-                clip.write_videofile(
-                    short_path,
-                    codec="libx264",
-                    audio_codec="aac",
-                    temp_audiofile=os.path.join(self.config.app.temp_dir, "temp_audio.m4a"),
-                    remove_temp=True,
-                    preset="ultrafast",  # Use "medium" or "slow" for final production
-                    threads=4,
-                    logger=None  # Suppress moviepy's verbose logging
-                )
+                # A single encode runs here, so MoviePy's default thread count is kept
+                temp_audiofile = self._temp_audio_path()
+                try:
+                    await asyncio.to_thread(
+                        clip.write_videofile,
+                        short_path,
+                        codec=self._codec,
+                        audio_codec="aac",
+                        temp_audiofile=temp_audiofile,
+                        remove_temp=True,
+                        preset=self._codec_preset,
+                        ffmpeg_params=self._codec_params,
+                        logger=None  # Suppress moviepy's verbose logging
+                    )
+                finally:
+                    if os.path.exists(temp_audiofile):
+                        os.remove(temp_audiofile)
             
             logger.success(f"Created YouTube Short from compilation: {short_path}")
             return short_path
@@ -126,6 +232,82 @@ class ShortsGenerator:
             logger.error(f"Error creating Short from compilation: {str(e)}")
             return None
     
+    async def _render_compilation_short_ffmpeg(
+        self,
+        compilation_path: str,
+        short_path: str,
+        max_duration: float,
+        include_branding: bool
+    ) -> bool:
+        """
+        Render a Short from a compilation with one ffmpeg filter graph.
+        
+        Args:
+            compilation_path: Path to the compilation video
+            short_path: Path to write the Short to
+            max_duration: Maximum duration for the Short in seconds
+            include_branding: Whether to include branding on the Short
+            
+        Returns:
+            True if the Short was written, False if rendering failed
+        """
+        try:
+            probe = await asyncio.to_thread(ffmpeg.probe, compilation_path)
+            video_stream = next(st for st in probe["streams"] if st["codec_type"] == "video")
+            width, height = int(video_stream["width"]), int(video_stream["height"])
+            has_audio = any(st["codec_type"] == "audio" for st in probe["streams"])
+            duration = float(probe["format"]["duration"])
+            
+            # Take the first part of the compilation if it is too long
+            if duration > max_duration:
+                logger.info(f"Compilation video is {duration:.1f}s, truncating to {max_duration:.1f}s")
+            
+            source = ffmpeg.input(compilation_path, t=max_duration)
+            video = source.video
+            needs_encode = include_branding
+            
+            # If the video is wider than 9:16, crop it to make it vertical;
+            # integer cross-multiplication skips exact 9:16 inputs entirely
+            ar_width, ar_height = self._target_ar
+            if width * ar_height > height * ar_width:
+                needs_encode = True
+                new_width = height * ar_width // ar_height // 2 * 2  # Even width for yuv420p
+                x1 = (width - new_width) // 2
+                video = video.filter("crop", new_width, height, x1, 0)
+                width = new_width
+                logger.info(f"Cropped horizontal video to vertical format: {new_width}x{height}")
+            
+            # Add branding if requested
+            if include_branding:
+                video = self._add_branding_filters(video, width, height, creator="TikTok Weekly Top")
+            
+            # The audio stream is copied untouched
+            streams = [video, source.audio] if has_audio else [video]
+            if needs_encode:
+                output_args = dict(self._ffmpeg_output_args)
+                # A single encode runs here, so let ffmpeg use every core
+                output_args.pop("threads")
+                if has_audio:
+                    output_args["acodec"] = "copy"
+            else:
+                # Already vertical and unbranded: truncation alone needs no re-encode
+                output_args = {"c": "copy"}
+            
+            await asyncio.to_thread(
+                ffmpeg.output(*streams, short_path, **output_args).overwrite_output().run,
+                cmd=get_setting("FFMPEG_BINARY"),
+                quiet=True
+            )
+            return True
+            
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode(errors="ignore") if e.stderr else str(e)
+            logger.warning(f"ffmpeg render failed, falling back to MoviePy: {stderr}")
+            return False
+        except Exception as e:
+            logger.warning(f"Error rendering Short with ffmpeg, falling back to MoviePy: {str(e)}")
+            return False
+    
     async def create_shorts_from_videos(
         self,
         video_metadata_list: List[VideoMetadata],
@@ -143,32 +325,49 @@ class ShortsGenerator:
         Returns:
             List of paths to the created Shorts
         """
-        shorts_paths = []
-        
         logger.info(f"Generating YouTube Shorts from {len(video_metadata_list)} videos")
         
-        for video_metadata in video_metadata_list:
-            try:
-                # Ensure the video exists
-                if not video_metadata.local_path or not os.path.exists(video_metadata.local_path):
-                    logger.warning(f"Video file not found: {video_metadata.local_path}")
-                    continue
-                
-                # Create short
-                short_path = await self._create_short(
-                    video_metadata=video_metadata,
-                    max_duration=max_duration,
-                    include_branding=include_branding
-                )
-                
-                if short_path:
-                    shorts_paths.append(short_path)
-                    logger.success(f"Created YouTube Short: {short_path}")
-                
-            except Exception as e:
-                logger.error(f"Error creating Short from {video_metadata.local_path}: {str(e)}")
+        # Run several encodes at once, each with fewer threads, to keep all cores busy;
+        # hardware encoders are limited by the driver's session cap instead
+        max_encodes = (os.cpu_count() or 1) // self.ENCODER_THREADS
+        if self._codec in HW_H264_ENCODERS:
+            max_encodes = min(max_encodes, HW_MAX_SESSIONS)
+        semaphore = asyncio.Semaphore(max(1, max_encodes))
+        
+        async def create_bounded(video_metadata: VideoMetadata) -> Optional[str]:
+            async with semaphore:
+                try:
+                    # Ensure the video exists and is non-empty with a single stat() call
+                    try:
+                        if not video_metadata.local_path:
+                            raise FileNotFoundError
+                        file_size = os.stat(video_metadata.local_path).st_size
+                    except FileNotFoundError:
+                        logger.warning(f"Video file not found: {video_metadata.local_path}")
+                        return None
+                    
+                    if file_size == 0:
+                        logger.warning(f"Video file is empty: {video_metadata.local_path}")
+                        return None
+                    
+                    # Create short
+                    short_path = await self._create_short(
+                        video_metadata=video_metadata,
+                        max_duration=max_duration,
+                        include_branding=include_branding
+                    )
+                    
+                    if short_path:
+                        logger.success(f"Created YouTube Short: {short_path}")
+                    return short_path
+                    
+                except Exception as e:
+                    logger.error(f"Error creating Short from {video_metadata.local_path}: {str(e)}")
+                    return None
+        
+        results = await asyncio.gather(*map(create_bounded, video_metadata_list))
         
-        return shorts_paths
+        return [short_path for short_path in results if short_path]
     
     async def _create_short(
         self,
@@ -194,7 +393,23 @@ class ShortsGenerator:
                 title=video_metadata.desc or video_metadata.author
             )
             
-            # Load the video
+            # Videos that are already 9:16 need no re-encode when unbranded
+            if not include_branding and await self._copy_if_vertical(
+                video_metadata.local_path, short_path, max_duration
+            ):
+                return short_path
+            
+            # Truncate and brand in a single ffmpeg filter graph
+            creator = video_metadata.author or "TikTok Creator"
+            if await self._render_short_ffmpeg(
+                video_metadata.local_path,
+                short_path,
+                max_duration,
+                creator=creator if include_branding else None
+            ):
+                return short_path
+            
+            # Fall back to compositing with MoviePy
             with VideoFileClip(video_metadata.local_path) as clip:
                 # Trim video if needed
                 if clip.duration > max_duration:
@@ -205,20 +420,28 @@ class ShortsGenerator:
                 if include_branding:
                     clip = await self._add_branding_to_short(
                         clip=clip,
-                        creator=video_metadata.author or "TikTok Creator"
+                        creator=creator
                     )
                 
-                # Write the Short
-                clip.write_videofile(
-                    short_path,
-                    codec="libx264",
-                    audio_codec="aac",
-                    temp_audiofile=os.path.join(self.config.app.temp_dir, "temp_audio.m4a"),
-                    remove_temp=True,
-                    preset="ultrafast",  # Use "medium" or "slow" for final production
-                    threads=4,
-                    logger=None  # Suppress moviepy's verbose logging
-                )
+                # Write the Short in a worker thread so other Shorts can encode
+                # concurrently; each write gets its own temp audio file
+                temp_audiofile = self._temp_audio_path()
+                try:
+                    await asyncio.to_thread(
+                        clip.write_videofile,
+                        short_path,
+                        codec=self._codec,
+                        audio_codec="aac",
+                        temp_audiofile=temp_audiofile,
+                        remove_temp=True,
+                        preset=self._codec_preset,
+                        ffmpeg_params=self._codec_params,
+                        threads=self.ENCODER_THREADS,
+                        logger=None  # Suppress moviepy's verbose logging
+                    )
+                finally:
+                    if os.path.exists(temp_audiofile):
+                        os.remove(temp_audiofile)
             
             return short_path
             
@@ -226,6 +449,196 @@ class ShortsGenerator:
             logger.error(f"Error creating Short: {str(e)}")
             return None
     
+    async def _copy_if_vertical(self, video_path: str, short_path: str, max_duration: float) -> bool:
+        """
+        Stream-copy a video that already has the 9:16 Shorts aspect ratio.
+        
+        The streams are copied without decoding; only truncation to
+        max_duration is applied.
+        
+        Args:
+            video_path: Path to the source video
+            short_path: Path to write the Short to
+            max_duration: Maximum duration for the Short in seconds
+            
+        Returns:
+            True if the Short was written, False if the video needs re-encoding
+        """
+        try:
+            probe = await asyncio.to_thread(ffmpeg.probe, video_path)
+            video_stream = next((st for st in probe["streams"] if st["codec_type"] == "video"), None)
+            if video_stream is None:
+                return False
+            
+            width, height = int(video_stream["width"]), int(video_stream["height"])
+            ar_width, ar_height = self._target_ar
+            if width * ar_height != height * ar_width:
+                return False
+            
+            duration = float(probe["format"]["duration"])
+            if duration > max_duration:
+                logger.info(f"Trimming video from {duration:.1f}s to {max_duration:.1f}s")
+            
+            await asyncio.to_thread(
+                ffmpeg.input(video_path, t=max_duration).output(short_path, c="copy").overwrite_output().run,
+                cmd=get_setting("FFMPEG_BINARY"),
+                quiet=True
+            )
+            logger.debug(f"Stream-copied vertical video to {short_path}")
+            return True
+            
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode(errors="ignore") if e.stderr else str(e)
+            logger.debug(f"Stream copy failed, re-encoding instead: {stderr}")
+            return False
+        except (KeyError, TypeError, ValueError) as e:
+            # Probe output without usable dimensions or duration
+            logger.debug(f"Could not read video properties, re-encoding instead: {str(e)}")
+            return False
+    
+    async def _render_short_ffmpeg(
+        self,
+        video_path: str,
+        short_path: str,
+        max_duration: float,
+        creator: Optional[str] = None
+    ) -> bool:
+        """
+        Render a Short from a single video with one ffmpeg filter graph.
+        
+        Decoding, branding overlays and encoding all stay inside ffmpeg, so
+        no frame is converted to a NumPy array.
+        
+        Args:
+            video_path: Path to the source video
+            short_path: Path to write the Short to
+            max_duration: Maximum duration for the Short in seconds
+            creator: Creator handle for the branding overlay, or None for no branding
+            
+        Returns:
+            True if the Short was written, False if rendering failed
+        """
+        try:
+            probe = await asyncio.to_thread(ffmpeg.probe, video_path)
+            video_stream = next(st for st in probe["streams"] if st["codec_type"] == "video")
+            width, height = int(video_stream["width"]), int(video_stream["height"])
+            has_audio = any(st["codec_type"] == "audio" for st in probe["streams"])
+            
+            duration = float(probe["format"]["duration"])
+            if duration > max_duration:
+                logger.info(f"Trimming video from {duration:.1f}s to {max_duration:.1f}s")
+            
+            source = ffmpeg.input(video_path, t=max_duration)
+            video = source.video
+            if creator is not None:
+                video = self._add_branding_filters(video, width, height, creator=creator)
+            
+            streams = [video, source.audio] if has_audio else [video]
+            output_args = dict(self._ffmpeg_output_args)
+            if has_audio:
+                output_args["acodec"] = "aac"
+            
+            await asyncio.to_thread(
+                ffmpeg.output(*streams, short_path, **output_args).overwrite_output().run,
+                cmd=get_setting("FFMPEG_BINARY"),
+                quiet=True
+            )
+            return True
+            
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode(errors="ignore") if e.stderr else str(e)
+            logger.warning(f"ffmpeg render failed, falling back to MoviePy: {stderr}")
+            return False
+        except Exception as e:
+            logger.warning(f"Error rendering Short with ffmpeg, falling back to MoviePy: {str(e)}")
+            return False
+    
+    def _temp_audio_path(self) -> str:
+        """
+        Create a unique temporary audio file path for a MoviePy write.
+        
+        Uses the /dev/shm RAM disk when available so the intermediate audio
+        never touches the disk, falling back to the configured temp directory.
+        
+        Returns:
+            Path to an empty temporary .m4a file
+        """
+        temp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else self.config.app.temp_dir
+        with tempfile.NamedTemporaryFile(suffix=".m4a", dir=temp_dir, delete=False) as temp_file:
+            return temp_file.name
+    
+    def _build_ffmpeg_output_args(self) -> dict:
+        """
+        Build ffmpeg-python output options for the selected H.264 encoder.
+        
+        Encodes are limited to ENCODER_THREADS threads so that the concurrent
+        per-video encodes together fill the CPU without oversubscribing it.
+        
+        Returns:
+            Dictionary of output options
+        """
+        if self._codec == "libx264":
+            options = {"preset": self._codec_preset, "pix_fmt": "yuv420p"}
+        else:
+            params = self._codec_params
+            options = {name.lstrip("-"): value for name, value in zip(params[::2], params[1::2])}
+        return {"vcodec": self._codec, **options, "threads": self.ENCODER_THREADS}
+    
+    @staticmethod
+    def _add_branding_filters(video, width: int, height: int, creator: str):
+        """
+        Add the Shorts branding overlay as ffmpeg filters.
+        
+        Draws the same elements as _add_branding_to_short (creator credit and
+        the "watch full video" banner) without MoviePy compositing.
+        
+        Args:
+            video: ffmpeg-python video stream
+            width: Frame width
+            height: Frame height
+            creator: Original creator's handle
+            
+        Returns:
+            ffmpeg-python video stream with branding filters applied
+        """
+        fontsize = int(height * 0.035)  # Scale font size based on video height
+        
+        # Credit to original creator at the top
+        video = video.drawtext(
+            text=f"@{creator}",
+            x="(w-text_w)/2",
+            y=int(height * 0.05),
+            fontsize=fontsize,
+            fontcolor="white",
+            font="Arial:style=Bold",
+            borderw=1,
+            bordercolor="black"
+        )
+        
+        # Semi-transparent banner behind the call-to-action
+        bg_width = int(width * 0.95)
+        bg_height = int(height * 0.09)
+        banner_y_position = height * 0.85
+        video = video.drawbox(
+            x=int((width - bg_width) / 2),
+            y=int(banner_y_position - bg_height / 2),
+            width=bg_width,
+            height=bg_height,
+            color="black@0.7",
+            thickness="fill"
+        )
+        
+        return video.drawtext(
+            text="WATCH FULL VIDEO ON YOUTUBE",
+            x="(w-text_w)/2",
+            y=int(banner_y_position),
+            fontsize=fontsize,
+            fontcolor="#FF0000",  # YouTube red
+            font="Arial:style=Bold",
+            borderw=2,
+            bordercolor="white"
+        )
+    
     async def _add_branding_to_short(
         self,
         clip: VideoFileClip,
@@ -250,7 +663,7 @@ class ShortsGenerator:
             elements = [clip]
             
             # Credit to original creator at the top
-            creator_text = TextClip(
+            creator_text = text_clip(
                 f"@{creator}",
                 fontsize=fontsize,
                 color="white",
@@ -269,17 +682,20 @@ class ShortsGenerator:
             # Position the banner higher up from the bottom
             banner_y_position = height * 0.85 
             
-            bg_clip = ColorClip(
-                size=(bg_width, bg_height),
-                color=(0, 0, 0)
-            )
-            bg_clip = bg_clip.set_opacity(0.7)  # Semi-transparent
+            bg_clip = self._banner_cache.get((bg_width, bg_height))
+            if bg_clip is None:
+                bg_clip = ColorClip(
+                    size=(bg_width, bg_height),
+                    color=(0, 0, 0)
+                )
+                bg_clip = bg_clip.set_opacity(0.7)  # Semi-transparent
+                self._banner_cache[(bg_width, bg_height)] = bg_clip
             bg_clip = bg_clip.set_position(("center", banner_y_position - bg_height/2))
             bg_clip = bg_clip.set_duration(clip.duration)
             elements.append(bg_clip)
             
             # Create the text on top of the background - slightly smaller font
-            watch_text = TextClip(
+            watch_text = text_clip(
                 "WATCH FULL VIDEO ON YOUTUBE",
                 fontsize=int(fontsize * 1.0),  # Reduced from 1.2
                 color="#FF0000",  # YouTube red
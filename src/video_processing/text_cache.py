@@ -0,0 +1,86 @@
+"""
+Text Cache Module
+
+Caches rasterized text overlays shared by the compiler and the Shorts generator.
+"""
+
+import functools
+from typing import Optional, Tuple
+
+import numpy as np
+from moviepy.editor import ImageClip, TextClip
+
+
+@functools.lru_cache(maxsize=128)
+def render_text(
+    text: str,
+    fontsize: int,
+    color: str,
+    font: str,
+    stroke_color: Optional[str] = None,
+    stroke_width: int = 1
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize a text overlay once and cache the result.
+    
+    TextClip shells out to ImageMagick on every call, while most overlays are
+    identical for every video in a compilation or batch of Shorts.
+    
+    Args:
+        text: Text to render
+        fontsize: Font size
+        color: Text color
+        font: Font name
+        stroke_color: Outline color, or None for no outline
+        stroke_width: Outline width
+    
+    Returns:
+        Tuple of (RGB frame, alpha mask) arrays
+    """
+    txt_clip = TextClip(
+        text,
+        fontsize=fontsize,
+        color=color,
+        font=font,
+        stroke_color=stroke_color,
+        stroke_width=stroke_width,
+        align="center"
+    )
+    try:
+        # Keep pixels in uint8; the mask only needs float32 precision
+        frame = txt_clip.get_frame(0).astype(np.uint8, copy=False)
+        mask = txt_clip.mask.get_frame(0).astype(np.float32, copy=False)
+        return frame, mask
+    finally:
+        txt_clip.close()
+
+
+def text_clip(
+    text: str,
+    fontsize: int,
+    color: str,
+    font: str,
+    duration: Optional[float] = None,
+    stroke_color: Optional[str] = None,
+    stroke_width: int = 1
+) -> ImageClip:
+    """
+    Build a text overlay clip from the cached rasterization.
+    
+    Args:
+        text: Text to render
+        fontsize: Font size
+        color: Text color
+        font: Font name
+        duration: Duration of the clip in seconds, or None to leave it unset
+        stroke_color: Outline color, or None for no outline
+        stroke_width: Outline width
+    
+    Returns:
+        ImageClip with the rendered text and its transparency mask
+    """
+    frame, mask = render_text(text, fontsize, color, font, stroke_color, stroke_width)
+    clip = ImageClip(frame).set_mask(ImageClip(mask, ismask=True))
+    if duration is not None:
+        clip = clip.set_duration(duration)
+    return clip
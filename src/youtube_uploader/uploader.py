@@ -4,15 +4,24 @@ YouTube Uploader Module
 Handles authentication with YouTube API and uploading of compilation videos with metadata.
 """
 
+import asyncio
+import http.client
 import os
+import random
+import socket
+import ssl
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
+import httplib2
+from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 from loguru import logger
 
 from src.utils.file_manager import FileManager
@@ -26,6 +35,28 @@ class YouTubeUploader:
     SCOPES = ["https://www.googleapis.com/auth/youtube.upload", 
               "https://www.googleapis.com/auth/youtube"]
     
+    # Resumable upload chunk size; each chunk is one HTTPS request
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+    
+    # Socket timeout for API requests in seconds
+    HTTP_TIMEOUT = 120
+    
+    # Maximum number of calls the API accepts in one batch request
+    BATCH_MAX_REQUESTS = 50
+    
+    # Transient failures retried during an upload; the resumable session
+    # continues from the last chunk the server committed
+    RETRIABLE_STATUS_CODES = (500, 502, 503, 504)
+    RETRIABLE_EXCEPTIONS = (
+        httplib2.HttpLib2Error,
+        http.client.HTTPException,
+        ConnectionError,
+        TimeoutError,
+        socket.timeout,
+        ssl.SSLError
+    )
+    MAX_UPLOAD_RETRIES = 5
+    
     def __init__(self, config, file_manager: Optional[FileManager] = None):
         """
         Initialize the YouTube uploader.
@@ -38,26 +69,39 @@ class YouTubeUploader:
         self.youtube_config = config.youtube
         self.file_manager = file_manager or FileManager()
         self.youtube = None
+        self._credentials = None
+        
+        # httplib2 connections are not thread-safe, so each thread gets its own
+        self._thread_local = threading.local()
         
         # Create tokens directory if it doesn't exist
         os.makedirs(os.path.dirname(self.youtube_config.token_path), exist_ok=True)
     
-    def authenticate(self) -> bool:
+    def authenticate(self, force_reauth: bool = False) -> bool:
         """
         Authenticate with the YouTube API.
         
+        The client is built once per uploader; later calls return immediately.
+        Credentials are read from the token file and only refreshed once expired.
+        
+        Args:
+            force_reauth: Ignore the cached token and run the OAuth flow again
+        
         Returns:
             True if authentication was successful, False otherwise
         """
+        if self.youtube is not None and not force_reauth:
+            return True
+        
         try:
             credentials = None
             
             # Check if token file exists
-            if os.path.exists(self.youtube_config.token_path):
+            if not force_reauth and os.path.exists(self.youtube_config.token_path):
                 logger.info("Loading credentials from token file")
                 try:
-                    credentials = Credentials.from_authorized_user_info(
-                        info=eval(open(self.youtube_config.token_path, 'r').read()),
+                    credentials = Credentials.from_authorized_user_file(
+                        self.youtube_config.token_path,
                         scopes=self.SCOPES
                     )
                 except Exception as e:
@@ -68,7 +112,10 @@ class YouTubeUploader:
                 if credentials and credentials.expired and credentials.refresh_token:
                     try:
                         logger.info("Refreshing expired credentials")
-                        credentials.refresh()
+                        credentials.refresh(Request())
+                        
+                        # Persist the new access token so later runs skip the refresh
+                        self._save_credentials(credentials)
                     except Exception as e:
                         logger.error(f"Error refreshing credentials: {str(e)}")
                         credentials = None
@@ -89,15 +136,20 @@ class YouTubeUploader:
                         credentials = flow.run_local_server(port=0)
                         
                         # Save the credentials for future use
-                        with open(self.youtube_config.token_path, 'w') as token:
-                            token.write(str(credentials.to_json()))
-                        logger.info(f"Credentials saved to {self.youtube_config.token_path}")
+                        self._save_credentials(credentials)
                     except Exception as e:
                         logger.error(f"Authentication error: {str(e)}")
                         return False
             
-            # Build the YouTube API client
-            self.youtube = build("youtube", "v3", credentials=credentials)
+            # The discovery document bundled with the client library avoids a network fetch
+            self._credentials = credentials
+            self._thread_local = threading.local()
+            self.youtube = build(
+                "youtube", "v3",
+                http=self._get_http(),
+                static_discovery=True,
+                cache_discovery=False
+            )
             logger.success("Successfully authenticated with YouTube API")
             return True
             
@@ -105,6 +157,50 @@ class YouTubeUploader:
             logger.error(f"Error in YouTube authentication: {str(e)}")
             return False
     
+    async def authenticate_async(self, force_reauth: bool = False) -> bool:
+        """
+        Authenticate with the YouTube API without blocking the event loop.
+        
+        Token file I/O, the OAuth flow and client construction run in a worker thread.
+        
+        Args:
+            force_reauth: Ignore the cached token and run the OAuth flow again
+        
+        Returns:
+            True if authentication was successful, False otherwise
+        """
+        return await asyncio.to_thread(self.authenticate, force_reauth)
+    
+    def _save_credentials(self, credentials: Credentials) -> None:
+        """
+        Write credentials to the token file.
+        
+        Args:
+            credentials: OAuth credentials to save
+        """
+        try:
+            with open(self.youtube_config.token_path, 'w') as token:
+                token.write(credentials.to_json())
+            logger.info(f"Credentials saved to {self.youtube_config.token_path}")
+        except Exception as e:
+            logger.warning(f"Error saving credentials: {str(e)}")
+    
+    def _get_http(self) -> AuthorizedHttp:
+        """
+        Get the authorized HTTP connection for the calling thread.
+        
+        Requests made from one thread reuse the same keep-alive TLS session,
+        while uploads running in parallel threads never share a connection.
+        
+        Returns:
+            Authorized HTTP object for the current thread
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http(timeout=self.HTTP_TIMEOUT))
+            self._thread_local.http = http
+        return http
+    
     def upload_video(
         self,
         video_path: str,
@@ -114,7 +210,9 @@ class YouTubeUploader:
         category_id: str = "22",  # "People & Blogs" category
         privacy_status: str = "private",
         thumbnail_path: Optional[str] = None,
-        notify_subscribers: bool = False
+        notify_subscribers: bool = False,
+        chunk_size_bytes: Optional[int] = None,
+        fileobj: Optional[BinaryIO] = None
     ) -> Optional[str]:
         """
         Upload a video to YouTube.
@@ -128,6 +226,8 @@ class YouTubeUploader:
             privacy_status: Privacy status (options: "private", "public", "unlisted")
             thumbnail_path: Optional path to a thumbnail image
             notify_subscribers: Whether to notify subscribers
+            chunk_size_bytes: Resumable upload chunk size (default: UPLOAD_CHUNK_SIZE)
+            fileobj: Already opened binary file to upload instead of reopening video_path
             
         Returns:
             YouTube video ID if upload was successful, None otherwise
@@ -136,7 +236,7 @@ class YouTubeUploader:
             logger.error("YouTube API client not initialized. Call authenticate() first.")
             return None
         
-        if not os.path.exists(video_path):
+        if fileobj is None and not os.path.exists(video_path):
             logger.error(f"Video file not found: {video_path}")
             return None
         
@@ -156,11 +256,20 @@ class YouTubeUploader:
             }
             
             # Prepare the media file
-            media = MediaFileUpload(
-                video_path,
-                mimetype="video/mp4",
-                resumable=True
-            )
+            if fileobj is not None:
+                media = MediaIoBaseUpload(
+                    fileobj,
+                    mimetype="video/mp4",
+                    chunksize=chunk_size_bytes or self.UPLOAD_CHUNK_SIZE,
+                    resumable=True
+                )
+            else:
+                media = MediaFileUpload(
+                    video_path,
+                    mimetype="video/mp4",
+                    chunksize=chunk_size_bytes or self.UPLOAD_CHUNK_SIZE,
+                    resumable=True
+                )
             
             logger.info(f"Starting upload of '{title}' to YouTube")
             
@@ -209,32 +318,36 @@ class YouTubeUploader:
             Video ID if successful, None otherwise
         """
         response = None
-        error = None
         retry = 0
-        retry_status_codes = [500, 502, 503, 504]
         
         while response is None:
+            error = None
             try:
                 logger.info("Uploading file...")
-                status, response = insert_request.next_chunk()
+                status, response = insert_request.next_chunk(http=self._get_http())
                 if status:
                     progress = int(status.progress() * 100)
                     logger.info(f"Upload progress: {progress}%")
             except HttpError as e:
-                if e.resp.status in retry_status_codes:
-                    error = f"A retriable HTTP error {e.resp.status} occurred: {e.content}"
-                    retry += 1
-                    if retry > 5:
-                        logger.error(f"Maximum retries exceeded: {error}")
-                        return None
-                    logger.warning(f"{error}. Retrying...")
-                    time.sleep(5 * retry)
-                else:
+                if e.resp.status not in self.RETRIABLE_STATUS_CODES:
                     logger.error(f"Non-retriable HTTP error: {e.resp.status} {e.content}")
                     return None
+                error = f"A retriable HTTP error {e.resp.status} occurred: {e.content}"
+            except self.RETRIABLE_EXCEPTIONS as e:
+                error = f"A retriable network error occurred: {str(e)}"
             except Exception as e:
                 logger.error(f"Unexpected error during upload: {str(e)}")
                 return None
+            
+            if error is not None:
+                retry += 1
+                if retry > self.MAX_UPLOAD_RETRIES:
+                    logger.error(f"Maximum retries exceeded: {error}")
+                    return None
+                # Exponential backoff with jitter so parallel uploaders don't retry in lockstep
+                delay = min(64, (2 ** retry) + random.random())
+                logger.warning(f"{error}. Retrying in {delay:.1f}s...")
+                time.sleep(delay)
         
         if response:
             return response.get('id')
@@ -266,7 +379,7 @@ class YouTubeUploader:
             self.youtube.thumbnails().set(
                 videoId=video_id,
                 media_body=media
-            ).execute()
+            ).execute(http=self._get_http())
             
             logger.success("Thumbnail set successfully")
             return True
@@ -278,6 +391,69 @@ class YouTubeUploader:
             logger.error(f"Error setting thumbnail: {str(e)}")
             return False
     
+    def get_channel_id(self) -> Optional[str]:
+        """
+        Get the ID of the channel the uploader is authenticated as.
+        
+        Returns:
+            Channel ID if available, None otherwise
+        """
+        if not self.youtube:
+            logger.error("YouTube API client not initialized. Call authenticate() first.")
+            return None
+        
+        try:
+            result = self.youtube.channels().list(
+                part="id",
+                mine=True
+            ).execute(http=self._get_http())
+            
+            items = result.get("items", [])
+            if not items:
+                logger.warning("No YouTube channel found for the authenticated account")
+                return None
+            
+            return items[0]["id"]
+            
+        except HttpError as e:
+            logger.error(f"HTTP error getting channel: {e.resp.status} {e.content}")
+            return None
+        except Exception as e:
+            logger.error(f"Error getting channel: {str(e)}")
+            return None
+    
+    def playlist_exists(self, playlist_id: str) -> Optional[bool]:
+        """
+        Check whether a playlist still exists on YouTube.
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            
+        Returns:
+            True if it exists, False if the API reports it gone, or None if
+            the check itself failed (e.g. a server or quota error)
+        """
+        if not self.youtube:
+            logger.error("YouTube API client not initialized. Call authenticate() first.")
+            return None
+        
+        try:
+            result = self.youtube.playlists().list(
+                part="id",
+                id=playlist_id
+            ).execute(http=self._get_http())
+            
+            return bool(result.get("items"))
+            
+        except HttpError as e:
+            if e.resp.status == 404:
+                return False
+            logger.error(f"HTTP error checking playlist: {e.resp.status} {e.content}")
+            return None
+        except Exception as e:
+            logger.error(f"Error checking playlist: {str(e)}")
+            return None
+    
     def create_playlist(
         self, 
         title: str, 
@@ -314,7 +490,7 @@ class YouTubeUploader:
                         "privacyStatus": privacy_status
                     }
                 }
-            ).execute()
+            ).execute(http=self._get_http())
             
             playlist_id = result["id"]
             logger.success(f"Playlist created with ID: {playlist_id}")
@@ -358,7 +534,7 @@ class YouTubeUploader:
                         }
                     }
                 }
-            ).execute()
+            ).execute(http=self._get_http())
             
             logger.success("Video added to playlist successfully")
             return True
@@ -369,6 +545,73 @@ class YouTubeUploader:
         except Exception as e:
             logger.error(f"Error adding to playlist: {str(e)}")
             return False
+    
+    def add_to_playlist_batch(self, playlist_id: str, video_ids: List[str]) -> bool:
+        """
+        Add several videos to a playlist using batched API requests.
+        
+        Up to BATCH_MAX_REQUESTS insertions are sent per HTTP round trip, so
+        populating a playlist with N videos costs N / 50 requests instead of N.
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            video_ids: YouTube video IDs, in playlist order
+            
+        Returns:
+            True if every video was added, False otherwise
+        """
+        if not self.youtube:
+            logger.error("YouTube API client not initialized. Call authenticate() first.")
+            return False
+        
+        failed = []
+        
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                video_id = video_ids[int(request_id)]
+                failed.append(video_id)
+                logger.error(f"Error adding video {video_id} to playlist: {str(exception)}")
+        
+        try:
+            logger.info(f"Adding {len(video_ids)} videos to playlist {playlist_id}")
+            
+            for start in range(0, len(video_ids), self.BATCH_MAX_REQUESTS):
+                batch = self.youtube.new_batch_http_request(callback=on_response)
+                
+                for index in range(start, min(start + self.BATCH_MAX_REQUESTS, len(video_ids))):
+                    batch.add(
+                        self.youtube.playlistItems().insert(
+                            part="snippet",
+                            body={
+                                "snippet": {
+                                    "playlistId": playlist_id,
+                                    "resourceId": {
+                                        "kind": "youtube#video",
+                                        "videoId": video_ids[index]
+                                    }
+                                }
+                            }
+                        ),
+                        # Batch request IDs must be unique; the list index is even when videos repeat
+                        request_id=str(index)
+                    )
+                
+                # Batches run sequentially: playlist positions follow insertion order
+                batch.execute(http=self._get_http())
+            
+            if failed:
+                logger.warning(f"Added {len(video_ids) - len(failed)}/{len(video_ids)} videos to playlist")
+                return False
+            
+            logger.success(f"Added {len(video_ids)} videos to playlist successfully")
+            return True
+            
+        except HttpError as e:
+            logger.error(f"HTTP error adding to playlist: {e.resp.status} {e.content}")
+            return False
+        except Exception as e:
+            logger.error(f"Error adding to playlist: {str(e)}")
+            return False
 
 
 # Example usage
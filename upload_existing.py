@@ -8,114 +8,281 @@ redoing the video collection and compilation process.
 
 import asyncio
 import argparse
+import functools
+import json
 import os
+import sys
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 from loguru import logger
 
 from src.utils.config_loader import ConfigLoader
 from src.utils.logger_config import setup_logger
-from src.youtube_uploader.uploader import YouTubeUploader
-from src.thumbnail_generator.generator import ThumbnailGenerator
 from src.utils.file_manager import FileManager
 
-async def upload_existing_compilation(
-    video_path: str,
-    title: str,
-    description: str = None,
-    thumbnail_path: str = None,
-    generate_thumbnail: bool = False
-):
+# The uploader and thumbnail generator pull in the Google API client, OpenCV and
+# MoviePy; they are imported where first used so --dry-run starts quickly
+if TYPE_CHECKING:
+    from src.youtube_uploader.uploader import YouTubeUploader
+
+# Playlist every uploaded compilation is added to
+PLAYLIST_NAME = "TikTok Compilations"
+
+# Uploads running at once; kept low to stay within YouTube's rate limits
+MAX_CONCURRENT_UPLOADS = 2
+
+# Resumable upload chunk size: 4 MiB on Unix, 8 MiB on Windows
+UPLOAD_CHUNK_SIZE = (8 if os.name == "nt" else 4) * 1024 * 1024
+
+# Description used when none is provided
+DEFAULT_DESCRIPTION = (
+    "🎬 Welcome to TikTok Weekly Top!\n\n"
+    "Dive into this week's best TikToks—handpicked viral hits, hilarious moments, and trending clips "
+    "that everyone's talking about! No endless scrolling needed; we've got your weekly dose of TikTok right here.\n\n"
+    "🔥 New compilations uploaded weekly—Subscribe and turn notifications on!\n\n"
+    "Disclaimer: All videos featured belong to their original creators. Follow and support their amazing content on TikTok!\n\n"
+    "📧 Want your video featured? Submit your TikTok link in the comments below!\n\n"
+    "Tags: #TikTok #TikTokWeekly #TikTokCompilation #Trending #ViralVideos #WeeklyTop"
+)
+
+# Tags applied to every uploaded compilation
+DEFAULT_TAGS = ("tiktok", "compilation", "highlights", "trending", "funny", "viral")
+
+# Placeholder video ID returned for videos validated by a dry run
+DRY_RUN_VIDEO_ID = "DRY-RUN"
+
+# File types accepted for uploads and custom thumbnails
+VIDEO_EXTENSIONS = {".mp4", ".mov", ".mkv", ".webm"}
+THUMBNAIL_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_config():
+    """Load the application configuration once per process."""
+    return ConfigLoader().get_config()
+
+
+def _check_dirs_writable(config) -> bool:
     """
-    Upload an existing compilation video to YouTube.
+    Check that the directories uploads write to are writable.
+    
+    The directories themselves are created by FileManager.
     
     Args:
-        video_path: Path to the existing compilation video
-        title: Title for the video on YouTube
-        description: Description for the video (uses default if None)
-        thumbnail_path: Path to the thumbnail image (optional)
-        generate_thumbnail: Whether to generate a new thumbnail
+        config: Application configuration
     
     Returns:
-        YouTube video ID if successful, None otherwise
+        True if every directory is usable, False otherwise
     """
-    # Ensure the video file exists
-    if not os.path.exists(video_path):
-        logger.error(f"Video file not found: {video_path}")
-        return None
+    for directory in (config.app.thumbnail_dir, config.app.cache_dir):
+        if not os.access(directory, os.W_OK):
+            logger.error(f"Directory is not writable: {directory}")
+            return False
     
-    # Initialize components
-    config = ConfigLoader().get_config()
-    file_manager = FileManager()
-    uploader = YouTubeUploader(config, file_manager)
+    return True
+
+
+def _resolve_playlist(uploader: "YouTubeUploader", config, privacy_status: str) -> Optional[str]:
+    """
+    Get the ID of the compilations playlist, creating it only once.
+    
+    Resolved IDs are stored in a JSON file under the cache directory, keyed by
+    channel, playlist title and privacy status, so later runs reuse the same
+    playlist instead of creating a duplicate every time.
+    
+    Args:
+        uploader: Authenticated YouTube uploader
+        config: Application configuration
+        privacy_status: Privacy status of the playlist
+    
+    Returns:
+        Playlist ID if available, None otherwise
+    """
+    cache_path = _playlist_cache_path(config)
+    cache = _load_playlist_cache(cache_path)
+    
+    # Playlists belong to a channel; without its ID the cache cannot be used safely
+    channel_id = uploader.get_channel_id()
+    cache_key = f"{channel_id}|{PLAYLIST_NAME}|{privacy_status}" if channel_id else None
+    
+    if cache_key in cache:
+        logger.info(f"Using cached playlist {cache[cache_key]} for {PLAYLIST_NAME}")
+        return cache[cache_key]
+    
+    # Create or update playlist
+    playlist_id = uploader.create_playlist(
+        title=PLAYLIST_NAME,
+        description="Automated TikTok compilations",
+        privacy_status=privacy_status
+    )
+    
+    if playlist_id and cache_key:
+        cache[cache_key] = playlist_id
+        _save_playlist_cache(cache_path, cache)
+    
+    return playlist_id
+
+
+def _forget_playlist(config, playlist_id: str) -> None:
+    """
+    Remove a playlist ID from the cache so the next run resolves it again.
     
-    # Generate default description if not provided
-    if not description:
-        description = (
-            "🎬 Welcome to TikTok Weekly Top!\n\n"
-            "Dive into this week's best TikToks—handpicked viral hits, hilarious moments, and trending clips "
-            "that everyone's talking about! No endless scrolling needed; we've got your weekly dose of TikTok right here.\n\n"
-            "🔥 New compilations uploaded weekly—Subscribe and turn notifications on!\n\n"
-            "Disclaimer: All videos featured belong to their original creators. Follow and support their amazing content on TikTok!\n\n"
-            "📧 Want your video featured? Submit your TikTok link in the comments below!\n\n"
-            "Tags: #TikTok #TikTokWeekly #TikTokCompilation #Trending #ViralVideos #WeeklyTop"
+    Args:
+        config: Application configuration
+        playlist_id: Playlist ID that no longer exists on YouTube
+    """
+    cache_path = _playlist_cache_path(config)
+    cache = _load_playlist_cache(cache_path)
+    stale_keys = [key for key, value in cache.items() if value == playlist_id]
+    
+    if stale_keys:
+        for key in stale_keys:
+            del cache[key]
+        _save_playlist_cache(cache_path, cache)
+        logger.info(f"Removed playlist {playlist_id} from the playlist cache")
+
+
+def _playlist_cache_path(config) -> Path:
+    """Path of the JSON file holding resolved playlist IDs."""
+    return Path(config.app.cache_dir) / "playlists.json"
+
+
+def _load_playlist_cache(cache_path: Path) -> dict:
+    """Read the playlist cache, treating a missing or corrupt file as empty."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_playlist_cache(cache_path: Path, cache: dict) -> None:
+    """Write the playlist cache, logging rather than raising on failure."""
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Error saving playlist cache {cache_path}: {str(e)}")
+
+
+@dataclass
+class UploadSpec:
+    """A video to upload along with its YouTube metadata."""
+    video_path: str
+    title: str
+    description: Optional[str] = None
+    thumbnail_path: Optional[str] = None
+    generate_thumbnail: bool = False
+    force_thumbnail: bool = False  # Regenerate even if a thumbnail for this video exists
+
+
+@dataclass(frozen=True)
+class UploadOptions:
+    """YouTube settings shared by every upload in a batch."""
+    tags: Tuple[str, ...] = DEFAULT_TAGS
+    privacy_status: str = "private"
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+    category_id: str = "22"  # People & Blogs
+    
+    @classmethod
+    def from_config(cls, config) -> "UploadOptions":
+        """Build the options from the YouTube section of the configuration."""
+        return cls(
+            privacy_status=config.youtube.privacy_status,
+            category_id=config.youtube.default_category_id
         )
+
+
+async def _upload_one(
+    spec: UploadSpec,
+    config,
+    options: UploadOptions,
+    file_manager: FileManager,
+    uploader: "YouTubeUploader",
+    auth_task: "asyncio.Task[bool]"
+) -> Optional[str]:
+    """
+    Upload a single video once the shared uploader is authenticated.
+    
+    The video file is expected to exist; upload_many checks it up front.
+    Thumbnail generation runs while authentication is still in progress.
+    
+    Args:
+        spec: Video to upload and its metadata
+        config: Application configuration
+        options: YouTube settings shared by the batch
+        file_manager: File manager instance
+        uploader: YouTube uploader shared by the batch
+        auth_task: Task resolving to whether authentication succeeded
+    
+    Returns:
+        YouTube video ID if successful, None otherwise
+    """
+    video = Path(spec.video_path)
+    title = spec.title
+    description = spec.description or DEFAULT_DESCRIPTION
+    thumbnail_path = spec.thumbnail_path
     
     # Generate thumbnail if requested and none provided
-    if generate_thumbnail and not thumbnail_path:
-        logger.info("Generating thumbnail from video...")
-        thumbnail_generator = ThumbnailGenerator(config, file_manager)
-        
+    if spec.generate_thumbnail and not thumbnail_path:
         # Generate output path
-        output_filename = f"thumbnail_{Path(video_path).stem}.jpg"
-        output_path = os.path.join(config.app.thumbnail_dir, output_filename)
-        
-        # Generate the thumbnail
-        thumbnail_path = await thumbnail_generator.create_basic_thumbnail(
-            title=title,
-            output_path=output_path
-        )
+        output_path = Path(config.app.thumbnail_dir) / f"thumbnail_{video.stem}.jpg"
         
-        if thumbnail_path:
-            logger.success(f"Generated thumbnail: {thumbnail_path}")
+        if output_path.exists() and not spec.force_thumbnail:
+            # Reuse the thumbnail an earlier run generated for this video
+            logger.info("Reusing thumbnail {}", output_path)
+            thumbnail_path = str(output_path)
         else:
-            logger.warning("Failed to generate thumbnail, continuing without it")
+            logger.info("Generating thumbnail from video...")
+            from src.thumbnail_generator.generator import ThumbnailGenerator
+            thumbnail_generator = ThumbnailGenerator(config, file_manager)
+            
+            # Generate the thumbnail
+            thumbnail_path = await thumbnail_generator.create_basic_thumbnail(
+                title=title,
+                output_path=str(output_path),
+                video_path=str(video)
+            )
+            
+            if thumbnail_path:
+                logger.success("Generated thumbnail: {}", thumbnail_path)
+            else:
+                logger.warning("Failed to generate thumbnail, continuing without it")
     
-    # Authenticate with YouTube
-    logger.info("Authenticating with YouTube...")
-    if not uploader.authenticate():
-        logger.error("YouTube authentication failed")
+    # Wait for authentication, which ran alongside the thumbnail
+    if not await auth_task:
         return None
     
-    # Upload the video
-    logger.info(f"Uploading video '{title}' to YouTube...")
-    video_id = uploader.upload_video(
-        video_path=video_path,
-        title=title,
-        description=description,
-        tags=["tiktok", "compilation", "highlights", "trending", "funny", "viral"],
-        privacy_status=config.youtube.privacy_status,
-        thumbnail_path=thumbnail_path
-    )
+    # Open the video once; an unreadable file fails here rather than mid-upload
+    try:
+        video_file = video.open("rb")
+    except OSError as e:
+        logger.error(f"Cannot read video file {video}: {str(e)}")
+        return None
     
-    if video_id:
-        logger.success(f"Video uploaded successfully with ID: {video_id}")
-        
-        # Create or update playlist
-        playlist_name = "TikTok Compilations"
-        playlist_id = uploader.create_playlist(
-            title=playlist_name,
-            description="Automated TikTok compilations",
-            privacy_status=config.youtube.privacy_status
+    # Upload the video in a worker thread so the event loop stays responsive.
+    # Per-video messages pass their values as arguments so loguru only
+    # formats them when the level is enabled
+    logger.info("Uploading video '{}' to YouTube...", title)
+    with video_file:
+        video_id = await asyncio.to_thread(
+            uploader.upload_video,
+            video_path=str(video),
+            title=title,
+            description=description,
+            tags=list(options.tags),
+            category_id=options.category_id,
+            privacy_status=options.privacy_status,
+            thumbnail_path=thumbnail_path,
+            chunk_size_bytes=options.chunk_size,
+            fileobj=video_file
         )
-        
-        if playlist_id:
-            uploader.add_to_playlist(playlist_id, video_id)
-            logger.info(f"Added to playlist: {playlist_name}")
-            
-        # Get the video URL
-        video_url = f"https://www.youtube.com/watch?v={video_id}"
-        logger.info(f"Video URL: {video_url}")
+    
+    if video_id:
+        logger.success("Video uploaded successfully with ID: {}", video_id)
+        logger.info("Video URL: https://www.youtube.com/watch?v={}", video_id)
         
         return video_id
     else:
@@ -123,38 +290,326 @@ async def upload_existing_compilation(
         return None
 
 
-async def main():
-    # Parse command-line arguments
+async def _add_to_playlist(
+    uploader: "YouTubeUploader",
+    config,
+    playlist_task: "asyncio.Task[Optional[str]]",
+    video_ids: List[str]
+) -> None:
+    """
+    Add the uploaded videos to the compilations playlist in batched requests.
+    
+    Args:
+        uploader: Authenticated YouTube uploader
+        config: Application configuration
+        playlist_task: Task resolving to the playlist ID (or None)
+        video_ids: YouTube video IDs, in playlist order
+    """
+    # The playlist was created while the videos uploaded
+    playlist_id = await playlist_task
+    if not playlist_id or not video_ids:
+        return
+    
+    if await asyncio.to_thread(uploader.add_to_playlist_batch, playlist_id, video_ids):
+        logger.info("Added to playlist: {}", PLAYLIST_NAME)
+    elif await asyncio.to_thread(uploader.playlist_exists, playlist_id) is False:
+        # Only a deleted playlist is forgotten; transient and quota errors keep
+        # the cached ID so the next run does not create a duplicate playlist
+        await asyncio.to_thread(_forget_playlist, config, playlist_id)
+
+
+async def upload_many(
+    specs: List[UploadSpec],
+    max_concurrency: int = MAX_CONCURRENT_UPLOADS,
+    force_reauth: bool = False,
+    dry_run: bool = False,
+    options: Optional[UploadOptions] = None
+) -> List[Optional[str]]:
+    """
+    Upload several existing videos to YouTube.
+    
+    Configuration, authentication and the playlist are set up once for the
+    whole batch, then up to max_concurrency uploads run at the same time.
+    Authentication overlaps thumbnail generation, and playlist creation
+    overlaps the first uploads. The uploaded videos are then added to the
+    playlist together, in spec order, with batched API requests.
+    
+    Args:
+        specs: Videos to upload and their metadata
+        max_concurrency: Maximum number of simultaneous uploads
+        force_reauth: Ignore the cached OAuth token and sign in again
+        dry_run: Only validate the videos; DRY_RUN_VIDEO_ID is returned for
+            each one that would be uploaded
+        options: YouTube settings for every upload (default: from the configuration)
+    
+    Returns:
+        YouTube video ID (or None on failure) for each spec, in order
+    """
+    video_ids: List[Optional[str]] = [None] * len(specs)
+    
+    # Check every video with a single stat() before spending time on authentication
+    pending = []
+    for index, spec in enumerate(specs):
+        video = Path(spec.video_path)
+        if video.suffix.lower() not in VIDEO_EXTENSIONS:
+            logger.error(f"Unsupported video file type: {spec.video_path}")
+            continue
+        try:
+            video.stat()
+        except FileNotFoundError:
+            logger.error(f"Video file not found: {spec.video_path}")
+            continue
+        except OSError as e:
+            logger.error(f"Cannot access video file {spec.video_path}: {str(e)}")
+            continue
+        pending.append(index)
+    
+    if not pending:
+        return video_ids
+    
+    # Skip all network work when only validating
+    if dry_run:
+        for index in pending:
+            logger.info("Dry run: would upload '{}' from {}", specs[index].title, specs[index].video_path)
+            video_ids[index] = DRY_RUN_VIDEO_ID
+        return video_ids
+    
+    # Initialize components
+    from src.youtube_uploader.uploader import YouTubeUploader
+    config = _get_config()
+    options = options or UploadOptions.from_config(config)
+    file_manager = FileManager(config)
+    uploader = YouTubeUploader(config, file_manager)
+    
+    async def authenticate() -> bool:
+        logger.info("Authenticating with YouTube...")
+        if await uploader.authenticate_async(force_reauth=force_reauth):
+            return True
+        logger.error("YouTube authentication failed")
+        return False
+    
+    async def resolve_playlist() -> Optional[str]:
+        if not await auth_task:
+            return None
+        return await asyncio.to_thread(_resolve_playlist, uploader, config, options.privacy_status)
+    
+    # Start authentication and playlist creation without waiting on them
+    auth_task = asyncio.create_task(authenticate())
+    playlist_task = asyncio.create_task(resolve_playlist())
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def upload_bounded(index: int) -> None:
+        spec = specs[index]
+        async with semaphore:
+            try:
+                video_ids[index] = await _upload_one(
+                    spec, config, options, file_manager, uploader, auth_task
+                )
+            except Exception as e:
+                logger.error(f"Error uploading {spec.video_path}: {str(e)}")
+    
+    await asyncio.gather(*map(upload_bounded, pending))
+    
+    # Add every uploaded video with one batched request per 50 videos
+    await _add_to_playlist(
+        uploader, config, playlist_task, [video_id for video_id in video_ids if video_id]
+    )
+    
+    return video_ids
+
+
+async def upload_existing_compilation(
+    video_path: str,
+    title: str,
+    description: str = None,
+    thumbnail_path: str = None,
+    generate_thumbnail: bool = False,
+    force_reauth: bool = False,
+    dry_run: bool = False
+):
+    """
+    Upload an existing compilation video to YouTube.
+    
+    Args:
+        video_path: Path to the existing compilation video
+        title: Title for the video on YouTube
+        description: Description for the video (uses default if None)
+        thumbnail_path: Path to the thumbnail image (optional)
+        generate_thumbnail: Whether to generate a new thumbnail
+        force_reauth: Ignore the cached OAuth token and sign in again
+        dry_run: Only validate the video without uploading it
+    
+    Returns:
+        YouTube video ID if successful (DRY_RUN_VIDEO_ID for a dry run), None otherwise
+    """
+    spec = UploadSpec(
+        video_path=video_path,
+        title=title,
+        description=description,
+        thumbnail_path=thumbnail_path,
+        generate_thumbnail=generate_thumbnail
+    )
+    video_ids = await upload_many([spec], force_reauth=force_reauth, dry_run=dry_run)
+    return video_ids[0]
+
+
+def load_manifest(manifest_path: Union[str, Path]) -> List[UploadSpec]:
+    """
+    Load upload specs from a JSON manifest.
+    
+    The manifest is a list of objects with the UploadSpec fields, e.g.
+    [{"video_path": "data/compilations/a.mp4", "title": "Weekly Top #1"}].
+    
+    Args:
+        manifest_path: Path to the manifest file
+    
+    Returns:
+        List of upload specs
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    
+    return [UploadSpec(**entry) for entry in entries]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="Upload existing compilation to YouTube")
-    parser.add_argument("--video", "-v", required=True, help="Path to the existing compilation video")
-    parser.add_argument("--title", "-t", required=True, help="Title for the YouTube video")
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument("--video", "-v", type=Path, help="Path to the existing compilation video")
+    source_group.add_argument("--manifest", "-m", type=Path, help="Path to a JSON manifest of videos to upload")
+    parser.add_argument("--title", "-t", help="Title for the YouTube video (required with --video)")
     parser.add_argument("--description", "-d", help="Description for the YouTube video")
-    parser.add_argument("--thumbnail", "-i", help="Path to the thumbnail image")
+    parser.add_argument("--thumbnail", "-i", type=Path, help="Path to the thumbnail image")
     parser.add_argument("--generate-thumbnail", "-g", action="store_true", help="Generate a thumbnail from the video")
+    parser.add_argument("--force-thumbnail", action="store_true",
+                        help="Regenerate the thumbnail even if one already exists for the video")
+    parser.add_argument("--max-concurrency", "-c", type=int, default=MAX_CONCURRENT_UPLOADS,
+                        help=f"Maximum simultaneous uploads with --manifest (default: {MAX_CONCURRENT_UPLOADS})")
+    parser.add_argument("--force-reauth", action="store_true", help="Ignore the cached OAuth token and sign in again")
+    parser.add_argument("--dry-run", action=argparse.BooleanOptionalAction, default=False,
+                        help="Validate the inputs without contacting YouTube")
     parser.add_argument("--log-level", "-l", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Logging level")
     args = parser.parse_args()
     
+    if args.video and not args.title:
+        parser.error("--title is required with --video")
+    
+    # Reject bad inputs before any configuration, OAuth or ffmpeg work
+    if args.video and args.video.suffix.lower() not in VIDEO_EXTENSIONS:
+        parser.error(f"--video must be one of {', '.join(sorted(VIDEO_EXTENSIONS))}: {args.video}")
+    if args.thumbnail and args.thumbnail.suffix.lower() not in THUMBNAIL_EXTENSIONS:
+        parser.error(f"--thumbnail must be one of {', '.join(sorted(THUMBNAIL_EXTENSIONS))}: {args.thumbnail}")
+    
+    return args
+
+
+async def main(args: argparse.Namespace) -> Tuple[List[UploadSpec], List[Optional[str]]]:
+    """
+    Upload the videos requested on the command line.
+    
+    Args:
+        args: Parsed command-line arguments
+    
+    Returns:
+        The requested uploads and the video ID (or None) for each of them
+    """
     # Setup logger
     setup_logger(args.log_level)
     
-    # Upload the video
-    video_id = await upload_existing_compilation(
-        video_path=args.video,
-        title=args.title,
-        description=args.description,
-        thumbnail_path=args.thumbnail,
-        generate_thumbnail=args.generate_thumbnail
-    )
+    # Fail early if outputs cannot be written, before any upload work starts
+    config = _get_config()
+    try:
+        FileManager(config)
+    except OSError as e:
+        logger.error(f"Cannot create output directories: {str(e)}")
+        return [], []
+    if not _check_dirs_writable(config):
+        return [], []
     
-    if video_id:
-        print(f"\nUpload successful! Video ID: {video_id}")
-        print(f"Video URL: https://www.youtube.com/watch?v={video_id}")
-        return 0
+    if args.manifest:
+        # Upload every video listed in the manifest
+        try:
+            specs = load_manifest(args.manifest)
+        except Exception as e:
+            logger.error(f"Error loading manifest {args.manifest}: {str(e)}")
+            return [], []
+        
+        if args.force_thumbnail:
+            specs = [replace(spec, force_thumbnail=True) for spec in specs]
     else:
-        print("\nUpload failed. See logs for details.")
+        specs = [UploadSpec(
+            video_path=str(args.video),
+            title=args.title,
+            description=args.description,
+            thumbnail_path=str(args.thumbnail) if args.thumbnail else None,
+            generate_thumbnail=args.generate_thumbnail,
+            force_thumbnail=args.force_thumbnail
+        )]
+    
+    video_ids = await upload_many(
+        specs,
+        max_concurrency=args.max_concurrency,
+        force_reauth=args.force_reauth,
+        dry_run=args.dry_run,
+        options=UploadOptions.from_config(config)
+    )
+    return specs, video_ids
+
+
+def print_results(specs: List[UploadSpec], video_ids: List[Optional[str]], dry_run: bool) -> int:
+    """
+    Print the outcome of each upload.
+    
+    Args:
+        specs: Requested uploads
+        video_ids: Video ID (or None) for each upload
+        dry_run: Whether the uploads were only validated
+    
+    Returns:
+        Process exit code: 0 if every upload succeeded, 1 otherwise
+    """
+    if not specs:
+        print("\nNothing to upload. See logs for details.")
         return 1
+    
+    if len(specs) == 1:
+        video_id = video_ids[0]
+        if video_id == DRY_RUN_VIDEO_ID:
+            print(f"\nDry run successful: {specs[0].video_path} is ready to upload")
+        elif video_id:
+            print(f"\nUpload successful! Video ID: {video_id}")
+            print(f"Video URL: https://www.youtube.com/watch?v={video_id}")
+        else:
+            print("\nUpload failed. See logs for details.")
+        return 0 if video_id else 1
+    
+    for spec, video_id in zip(specs, video_ids):
+        if video_id == DRY_RUN_VIDEO_ID:
+            print(f"Validated {spec.video_path}")
+        elif video_id:
+            print(f"Uploaded {spec.video_path}: https://www.youtube.com/watch?v={video_id}")
+        else:
+            print(f"Failed {spec.video_path}")
+    
+    succeeded = sum(1 for video_id in video_ids if video_id)
+    print(f"\n{succeeded}/{len(specs)} {'videos valid' if dry_run else 'uploads successful'}.")
+    return 0 if succeeded == len(specs) else 1
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    exit(exit_code) 
\ No newline at end of file
+    args = parse_args()
+    
+    # Run on the libuv-based event loop when it is installed
+    run = asyncio.run
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            run = uvloop.run
+        except ImportError:
+            pass
+    
+    specs, video_ids = run(main(args))
+    # Report after the event loop has shut down
+    sys.exit(print_results(specs, video_ids, args.dry_run))